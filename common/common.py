@@ -13,6 +13,56 @@ import re
 import json
 from typing import Any, Optional, Dict
 
+# orjson is much faster on large LLM payloads; fall back to the standard library without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Patterns used by parse_json_content, compiled once at import rather than on every call
+JSON_BLOCK_PATTERN = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+UNQUOTED_KEY_PATTERN = re.compile(r'(\w+):')
+
+# Decodes the object at the start of a ```json block in a single left-to-right pass
+JSON_DECODER = json.JSONDecoder()
+
+
+def loads_json(content):
+    """
+    Parse a JSON document, using orjson when it is installed.
+
+    Args:
+        content: JSON text as str or bytes
+
+    Returns:
+        The parsed Python object
+
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON
+            (orjson's decode error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dumps_json(data: Any, indent: bool = False) -> str:
+    """
+    Serialize data to a JSON string, using orjson when it is installed.
+
+    Args:
+        data: JSON-serializable data
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        The JSON document as a string (compact unless indent is set)
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None).decode()
+    if indent:
+        return json.dumps(data, indent=2)
+    return json.dumps(data, separators=(",", ":"))
+
 
 def parse_json_content(content: str) -> Optional[Dict[str, Any]]:
     """
@@ -25,9 +75,32 @@ def parse_json_content(content: str) -> Optional[Dict[str, Any]]:
     Returns:
         Parsed JSON dictionary or None if parsing fails
     """
+    # Fast paths for the two well-formed reply shapes; anything else (or a failure here)
+    # falls through to the extraction and repair steps below
+    stripped = content.strip()
+    if stripped.startswith('{'):
+        # The reply is the JSON object itself
+        try:
+            return loads_json(stripped)
+        except json.JSONDecodeError:
+            pass
+    else:
+        fence = content.find('```json')
+        if fence != -1:
+            # Decode the object opening the fenced block in one pass, without a regex scan
+            # and a second parse of the extracted text
+            start = fence + len('```json')
+            while start < len(content) and content[start].isspace():
+                start += 1
+            if content.startswith('{', start):
+                try:
+                    parsed_json, _ = JSON_DECODER.raw_decode(content, start)
+                    return parsed_json
+                except json.JSONDecodeError:
+                    pass
+
     # Try to match well-formed markdown blocks with both opening and closing ```
-    json_pattern = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
-    match = json_pattern.search(content)
+    match = JSON_BLOCK_PATTERN.search(content)
 
     if match:
         # If both ```json and ``` are present, extract the JSON content
@@ -48,7 +121,7 @@ def parse_json_content(content: str) -> Optional[Dict[str, Any]]:
 
     try:
         # Try to parse the JSON string directly
-        parsed_json = json.loads(json_str)
+        parsed_json = loads_json(json_str)
         return parsed_json
     except json.JSONDecodeError as e:
         print(f"Error parsing JSON on first attempt: {e}")
@@ -93,13 +166,13 @@ def parse_json_content(content: str) -> Optional[Dict[str, Any]]:
             fixed_json = ''.join(fixed_chars)
 
             try:
-                parsed_json = json.loads(fixed_json)
+                parsed_json = loads_json(fixed_json)
                 print("✓ Successfully parsed JSON after escaping control characters")
                 return parsed_json
             except:
                 # Try fixing unquoted keys as well
-                fixed_json = re.sub(r'(\w+):', r'"\1":', fixed_json)
-                parsed_json = json.loads(fixed_json)
+                fixed_json = UNQUOTED_KEY_PATTERN.sub(r'"\1":', fixed_json)
+                parsed_json = loads_json(fixed_json)
                 print("✓ Successfully parsed JSON after fixing control chars and unquoted keys")
                 return parsed_json
         except Exception as ex:
@@ -175,4 +248,23 @@ def save_json_file(data: Dict[str, Any], file_path: str) -> bool:
         return True
     except (IOError, TypeError) as e:
         print(f"Error saving JSON file {file_path}: {e}")
-        return False
\ No newline at end of file
+        return False
+
+
+def get_file_mtime(file_path: Optional[str]) -> Optional[float]:
+    """
+    Return a file's modification time, or None when there is no path or the file
+    is missing. One stat call answers both "does it exist" and "has it changed".
+
+    Args:
+        file_path: Path to the file, or None
+
+    Returns:
+        The modification time, or None
+    """
+    if not file_path:
+        return None
+    try:
+        return os.path.getmtime(file_path)
+    except OSError:
+        return None
@@ -0,0 +1,92 @@
+"""
+Streamlit Session Helpers
+
+This module provides the Streamlit-specific helpers shared by the Courseware AutoGen
+pages: a long-lived event loop and model clients kept per session, and the cached
+ZIP builder behind the "download all" buttons.
+
+Usage:
+    from common.streamlit_utils import run_async, get_model_client, build_documents_zip
+
+    client = get_model_client({"model": model_name, "api_key": api_key, "base_url": base_url})
+    result = run_async(generate_saq(fg_data, index, client))
+"""
+
+import asyncio
+import io
+import zipfile
+import streamlit as st
+from autogen_ext.models.openai import OpenAIChatCompletionClient
+
+
+def run_async(coro):
+    """
+    Run a coroutine to completion on this session's long-lived event loop.
+
+    Unlike asyncio.run, the loop is kept in session state between calls, so model
+    clients from get_model_client keep their open connections from one step (and
+    click) to the next. Every page shares the same loop.
+
+    Args:
+        coro: The coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    loop = st.session_state.get('event_loop')
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        st.session_state['event_loop'] = loop
+    return loop.run_until_complete(coro)
+
+
+def get_model_client(client_kwargs: dict) -> OpenAIChatCompletionClient:
+    """
+    Return an OpenAIChatCompletionClient for the given settings, reusing the client
+    built earlier in this session for the same settings.
+
+    Clients are cached per session rather than per process because their HTTP
+    connection pool is bound to the event loop that first used it, and each session
+    has its own loop (see run_async). Changing the model, API key or any other
+    setting yields a new client.
+
+    Args:
+        client_kwargs: Keyword arguments for OpenAIChatCompletionClient
+
+    Returns:
+        The cached or newly created client
+    """
+    clients = st.session_state.setdefault('model_clients', {})
+    cache_key = repr(sorted(client_kwargs.items()))
+    client = clients.get(cache_key)
+    if client is None:
+        client = OpenAIChatCompletionClient(**client_kwargs)
+        clients[cache_key] = client
+    return client
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def build_documents_zip(documents: tuple) -> bytes:
+    """
+    Pack generated documents into a ZIP archive for download.
+
+    Pass it to st.download_button as deferred data (functools.partial), so the
+    archive is only built when the user clicks Download rather than on every rerun.
+    Each document's modification time (see common.common.get_file_mtime) is part of
+    the cache key, so clicking again serves the archive from memory until a document
+    is regenerated.
+
+    Args:
+        documents: (file path, archive name, modification time) entries
+
+    Returns:
+        The ZIP archive contents
+    """
+    # The archive ends up cached as bytes anyway, so build it in memory; nothing is left
+    # behind if a document has gone missing since its modification time was read. The .docx
+    # files are already compressed, so the fastest deflate level loses almost nothing in size.
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+        for file_path, arcname, _ in documents:
+            zipf.write(file_path, arcname=arcname)
+    return buffer.getvalue()
@@ -37,8 +37,28 @@ Main Functionalities:
         - Function: interpret_cp(raw_data, model_client)
           Leverages an AI assistant (via the OpenAIChatCompletionClient) to extract and structure
           the course proposal data into a comprehensive JSON dictionary as defined by the CourseData model.
+        - Function: interpret_cp_cached(raw_data, model_key, _model_client)
+          Memoises the interpreter result per parsed CP and model configuration so repeated runs
+          on the same upload skip the extraction call.
           
-    5. Streamlit Application:
+    5. Content Generation:
+        - Function: generate_course_content(context, ...)
+          Runs the independent LLM steps for the selected documents (Learning Guide content,
+          assessment evidence and the timetable) concurrently before the documents are rendered.
+        - Function: render_documents(context, ...)
+          Renders the selected documents (LG, AP/ASR, LP, FG) side by side in worker threads once
+          their content and the timetable are ready.
+        - Model clients come from common.streamlit_utils.get_model_client and every async step
+          runs through common.streamlit_utils.run_async, so connections are reused across clicks.
+        - Function: load_logo_bytes(logo_path, mtime)
+          Serves unchanged organisation logos from memory, keyed on common.common.get_file_mtime.
+        - Constant: ORG_TABLE_PAGE_SIZE
+          Number of organisations shown per page of the organisation table.
+        - Constant: ZIP_DOCUMENTS
+          The generated documents offered in the ZIP download, which is built by
+          common.streamlit_utils.build_documents_zip only when the download button is clicked.
+          
+    6. Streamlit Application:
         - Function: app()
           Implements the user interface using Streamlit. This interface guides users through:
             - Uploading a Course Proposal document.
@@ -58,13 +78,12 @@ Dependencies:
         • Courseware.utils.model_configs       : For model configuration and selection.
         • Courseware.utils.organization_utils  : For managing organization data (CRUD).
     - External Libraries:
-        • os, io, zipfile, tempfile, json, time, asyncio, datetime
+        • os, re, tempfile, asyncio, datetime
+        • orjson (optional)                : For fast JSON serialization via common.common.
         • streamlit                        : For building the web UI.
-        • selenium & BeautifulSoup         : For web scraping tasks.
-        • docx                             : For generating and modifying Word documents.
+        • llama_cloud_services & llama_index : For parsing CP documents (imported on first parse).
         • pydantic                         : For data validation and structured models.
         • autogen_agentchat & autogen_core   : For AI-assisted text generation and processing.
-        • urllib.parse                     : For URL manipulation.
     
 Usage:
     - Configure API keys and endpoints in st.secrets (e.g., LLAMA_CLOUD_API_KEY, BROWSER_TOKEN,
@@ -90,41 +109,31 @@ Notes:
 """
 
 
-from generate_ap_fg_lg_lp.utils.agentic_LG import generate_learning_guide
-from generate_ap_fg_lg_lp.utils.agentic_AP import generate_assessment_documents
+from generate_ap_fg_lg_lp.utils.agentic_LG import generate_content, render_learning_guide
+from generate_ap_fg_lg_lp.utils.agentic_AP import generate_assessment_documents, ensure_assessment_evidence, evidence_client_params
 from generate_ap_fg_lg_lp.utils.timetable_generator import generate_timetable
 from generate_ap_fg_lg_lp.utils.agentic_LP import generate_lesson_plan
 from generate_ap_fg_lg_lp.utils.agentic_FG import generate_facilitators_guide
 from settings.model_configs import get_model_config
 import os
-import io
-import zipfile
+import re
 import tempfile
-import json 
-import time
 import asyncio
+from copy import deepcopy
+from functools import partial
+from string import Template
 from datetime import datetime
 import streamlit as st
-import urllib.parse
-from selenium import webdriver
-from docx import Document
-from docx.text.paragraph import Paragraph
-from docx.oxml.text.paragraph import CT_P
-from docx.oxml.table import CT_Tbl
-from docx.table import Table
-from selenium import webdriver
-from bs4 import BeautifulSoup
 from pydantic import BaseModel
-from typing import List, Optional
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.messages import TextMessage
 from autogen_core import CancellationToken
 from autogen_ext.models.openai import OpenAIChatCompletionClient
-from common.common import save_uploaded_file, parse_json_content
+from common.common import save_uploaded_file, parse_json_content, dumps_json, get_file_mtime
+from common.streamlit_utils import run_async, get_model_client, build_documents_zip
 # Import organisation CRUD utilities and model
 from generate_ap_fg_lg_lp.utils.organization_utils import (
     load_organizations,
-    save_organizations,
     add_organization,
     update_organization,
     delete_organization,
@@ -133,27 +142,24 @@ from generate_ap_fg_lg_lp.utils.organization_utils import (
 from streamlit_modal import Modal
 
 # Initialize session state variables
-if 'lg_output' not in st.session_state:
-    st.session_state['lg_output'] = None
-if 'ap_output' not in st.session_state:
-    st.session_state['ap_output'] = None
-if 'lp_output' not in st.session_state:
-    st.session_state['lp_output'] = None
-if 'fg_output' not in st.session_state:
-    st.session_state['fg_output'] = None
-if 'context' not in st.session_state:
-    st.session_state['context'] = None
-if 'asr_output' not in st.session_state:
-    st.session_state['asr_output'] = None
-if 'selected_model' not in st.session_state:
-    st.session_state['selected_model'] = "DeepSeek-Chat"
+SESSION_STATE_DEFAULTS = {
+    'lg_output': None,
+    'ap_output': None,
+    'lp_output': None,
+    'fg_output': None,
+    'context': None,
+    'asr_output': None,
+    'selected_model': "DeepSeek-Chat",
+}
+for key, default in SESSION_STATE_DEFAULTS.items():
+    st.session_state.setdefault(key, default)
 
 ############################################################
 # 1. Pydantic Models
 ############################################################
 class Topic(BaseModel):
     Topic_Title: str
-    Bullet_Points: List[str]
+    Bullet_Points: list[str]
 
 class KDescription(BaseModel):
     K_number: str
@@ -165,12 +171,12 @@ class ADescription(BaseModel):
 
 class LearningUnit(BaseModel):
     LU_Title: str
-    Topics: List[Topic]
+    Topics: list[Topic]
     LO: str
-    K_numbering_description: List[KDescription]
-    A_numbering_description: List[ADescription]
-    Assessment_Methods: List[str]
-    Instructional_Methods: List[str]
+    K_numbering_description: list[KDescription]
+    A_numbering_description: list[ADescription]
+    Assessment_Methods: list[str]
+    Instructional_Methods: list[str]
 
 class EvidenceDetail(BaseModel):
     LO: str
@@ -180,11 +186,11 @@ class AssessmentMethodDetail(BaseModel):
     Assessment_Method: str
     Method_Abbreviation: str
     Total_Delivery_Hours: str
-    Assessor_to_Candidate_Ratio: List[str]
-    Evidence: Optional[List[EvidenceDetail]] = None
-    Submission: Optional[List[str]] = None
-    Marking_Process: Optional[List[str]] = None
-    Retention_Period: Optional[str] = None
+    Assessor_to_Candidate_Ratio: list[str]
+    Evidence: list[EvidenceDetail] | None = None
+    Submission: list[str] | None = None
+    Marking_Process: list[str] | None = None
+    Retention_Period: str | None = None
 
 class CourseData(BaseModel):
     Date: str 
@@ -196,30 +202,36 @@ class CourseData(BaseModel):
     Total_Training_Hours: str 
     Total_Assessment_Hours: str 
     Total_Course_Duration_Hours: str 
-    Learning_Units: List[LearningUnit]
-    Assessment_Methods_Details: List[AssessmentMethodDetail]
+    Learning_Units: list[LearningUnit]
+    Assessment_Methods_Details: list[AssessmentMethodDetail]
 
 class Session(BaseModel):
     Time: str
     instruction_title: str
-    bullet_points: List[str]
+    bullet_points: list[str]
     Instructional_Methods: str
     Resources: str
 
 class DayLessonPlan(BaseModel):
     Day: str
-    Sessions: List[Session]
+    Sessions: list[Session]
 
 class LessonPlan(BaseModel):
-    lesson_plan: List[DayLessonPlan]
+    lesson_plan: list[DayLessonPlan]
+
+# The CourseData schema never changes at runtime, so serialize it once for the interpreter prompt.
+# It is only read by the model, so it is kept compact to save prompt tokens on every extraction
+COURSE_DATA_SCHEMA_JSON = dumps_json(CourseData.model_json_schema())
 
 ############################################################
 # 2. Course Proposal Document Parsing
 ############################################################
-from llama_cloud_services import LlamaParse
-from llama_index.core import SimpleDirectoryReader
-import os
-import re
+# Section markers bounding the relevant part of a parsed CP, one alternation per file type:
+# group 1 matches the start marker, group 2 the end marker
+CP_TRIM_PATTERNS = {
+    ".docx": re.compile(r"(Part\s*1.*?Particulars\s+of\s+Course)|(Part\s*4.*?Facilities\s+and\s+Resources)", re.IGNORECASE),
+    ".xlsx": re.compile(r"(1\s*-\s*Course\s*Particulars)|(4\s*-\s*Declarations)", re.IGNORECASE),
+}
 
 def parse_cp_document(uploaded_file):
     """
@@ -234,15 +246,26 @@ def parse_cp_document(uploaded_file):
       - Excludes everything before a line matching "1 - Course Particulars"
       - Excludes everything after a line matching "3 - Summary"
 
+    Results are cached on the file's contents, so regenerating documents for the same
+    CP does not send it through LlamaParse again.
+
     Args:
         uploaded_file (UploadedFile): The file uploaded via st.file_uploader.
 
     Returns:
         str: A trimmed Markdown string containing the parsed document content.
     """
+    return _parse_cp_bytes(uploaded_file.getvalue(), os.path.splitext(uploaded_file.name)[1])
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _parse_cp_bytes(file_bytes: bytes, suffix: str) -> str:
+    # LlamaParse and llama_index are heavy to import and only needed once a CP is parsed
+    from llama_cloud_services import LlamaParse
+    from llama_index.core import SimpleDirectoryReader
+
     # Write the uploaded file to a temporary file.
-    with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(uploaded_file.name)[1]) as tmp:
-        tmp.write(uploaded_file.read())
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        tmp.write(file_bytes)
         temp_file_path = tmp.name
 
     try:
@@ -260,25 +283,26 @@ def parse_cp_document(uploaded_file):
         documents = SimpleDirectoryReader(input_files=[temp_file_path], file_extractor=file_extractor).load_data()
     
         # Concatenate the parsed text from each Document object into a single Markdown string
-        markdown_text = "\n\n".join(doc.text for doc in documents)
-    
-        # Set up regex patterns based on file extension
-        if ext == ".docx":
-            start_pattern = re.compile(r"Part\s*1.*?Particulars\s+of\s+Course", re.IGNORECASE)
-            end_pattern = re.compile(r"Part\s*4.*?Facilities\s+and\s+Resources", re.IGNORECASE)
-        elif ext == ".xlsx":
-            start_pattern = re.compile(r"1\s*-\s*Course\s*Particulars", re.IGNORECASE)
-            end_pattern = re.compile(r"4\s*-\s*Declarations", re.IGNORECASE)
+        # (a single Document, the usual case, is used as-is without copying)
+        if len(documents) == 1:
+            markdown_text = documents[0].text
         else:
-            start_pattern = None
-            end_pattern = None
+            markdown_text = "\n\n".join([doc.text for doc in documents])
     
-        # If both patterns exist, search for the matches and trim the text
-        if start_pattern and end_pattern:
-            start_match = start_pattern.search(markdown_text)
-            end_match = end_pattern.search(markdown_text)
-            if start_match and end_match and end_match.start() > start_match.start():
-                markdown_text = markdown_text[start_match.start():end_match.start()].strip()
+        # Find the first start and end markers for this file type in a single scan and trim the text
+        trim_pattern = CP_TRIM_PATTERNS.get(ext)
+        if trim_pattern:
+            start_pos = end_pos = None
+            for match in trim_pattern.finditer(markdown_text):
+                if match.group(1) is not None:
+                    if start_pos is None:
+                        start_pos = match.start()
+                elif end_pos is None:
+                    end_pos = match.start()
+                if start_pos is not None and end_pos is not None:
+                    break
+            if start_pos is not None and end_pos is not None and end_pos > start_pos:
+                markdown_text = markdown_text[start_pos:end_pos].strip()
     
     finally:
         # Clean up the temporary file
@@ -289,34 +313,9 @@ def parse_cp_document(uploaded_file):
 ############################################################
 # 2. Interpret Course Proposal Data
 ############################################################
-async def interpret_cp(raw_data: dict, model_client: OpenAIChatCompletionClient) -> dict:
-    """
-    Interprets and extracts structured data from a raw Course Proposal (CP) document.
-
-    This function processes raw CP data using an AI model to extract 
-    structured information such as course details, learning units, topics, 
-    assessment methods, and instructional methods.
-
-    Args:
-        raw_data (dict): 
-            The unstructured data extracted from the CP document.
-        model_client (OpenAIChatCompletionClient): 
-            The AI model client used for structured data extraction.
-
-    Returns:
-        dict: 
-            A structured dictionary containing course details.
-
-    Raises:
-        Exception: 
-            If the AI-generated response does not contain the expected fields.
-    """
-
-    # Interpreter Agent with structured output enforcement
-    interpreter = AssistantAgent(
-        name="Interpreter",
-        model_client=model_client,
-        system_message=f"""
+# The interpreter instructions only depend on the CourseData schema, so the prompt is
+# filled in once at import and shared by every interpret_cp call
+INTERPRETER_SYSTEM_MESSAGE_TEMPLATE = Template("""
         You are an AI assistant that helps extract specific information from a JSON object containing a Course Proposal Form (CP). Your task is to interpret the JSON data, regardless of its structure, and extract the required information accurately.
 
         ---
@@ -395,8 +394,59 @@ async def interpret_cp(raw_data: dict, model_client: OpenAIChatCompletionClient)
         - Do not include any extraneous information or duplicate entries.
 
         Generate structured output matching this schema:
-        {json.dumps(CourseData.model_json_schema(), indent=2)}
-        """,
+        $schema
+        """)
+INTERPRETER_SYSTEM_MESSAGE = INTERPRETER_SYSTEM_MESSAGE_TEMPLATE.substitute(schema=COURSE_DATA_SCHEMA_JSON)
+
+# Dashes and curly quotes the interpreter is asked to normalise, mapped in a single translate pass
+PUNCTUATION_TABLE = str.maketrans({
+    "\u2013": "-", "\u2014": "-",
+    "\u2018": "'", "\u2019": "'",
+    "\u201c": '"', "\u201d": '"',
+})
+
+def normalize_punctuation(value):
+    """
+    Replaces en/em dashes and curly quotes with their ASCII equivalents in every string of a
+    parsed JSON value, so the normalisation asked of the model holds even when it misses some.
+    """
+
+    if isinstance(value, str):
+        return value.translate(PUNCTUATION_TABLE)
+    if isinstance(value, list):
+        return [normalize_punctuation(item) for item in value]
+    if isinstance(value, dict):
+        return {key: normalize_punctuation(item) for key, item in value.items()}
+    return value
+
+async def interpret_cp(raw_data: dict, model_client: OpenAIChatCompletionClient) -> dict:
+    """
+    Interprets and extracts structured data from a raw Course Proposal (CP) document.
+
+    This function processes raw CP data using an AI model to extract 
+    structured information such as course details, learning units, topics, 
+    assessment methods, and instructional methods.
+
+    Args:
+        raw_data (dict): 
+            The unstructured data extracted from the CP document.
+        model_client (OpenAIChatCompletionClient): 
+            The AI model client used for structured data extraction.
+
+    Returns:
+        dict: 
+            A structured dictionary containing course details.
+
+    Raises:
+        Exception: 
+            If the AI-generated response does not contain the expected fields.
+    """
+
+    # Interpreter Agent with structured output enforcement
+    interpreter = AssistantAgent(
+        name="Interpreter",
+        model_client=model_client,
+        system_message=INTERPRETER_SYSTEM_MESSAGE,
     )
 
     agent_task = f"""
@@ -425,6 +475,7 @@ async def interpret_cp(raw_data: dict, model_client: OpenAIChatCompletionClient)
             print("ERROR: parse_json_content returned None - invalid JSON")
             print(f"Raw response (truncated): {raw_content[:1000]}...")
             raise Exception(f"Failed to parse JSON from model response. Raw content: {raw_content[:500]}...")
+        context = normalize_punctuation(context)
 
         # Debug: Check if K and A statements were extracted
         if "Learning_Units" in context:
@@ -438,6 +489,220 @@ async def interpret_cp(raw_data: dict, model_client: OpenAIChatCompletionClient)
         print(f"ERROR: Exception during JSON parsing: {parse_error}")
         raise Exception(f"Error parsing structured output: {parse_error}. Raw response: {raw_content[:200]}...")
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def interpret_cp_cached(raw_data: str, model_key: str, _model_client: OpenAIChatCompletionClient) -> dict:
+    """
+    Runs interpret_cp once per parsed CP and model configuration.
+
+    The interpreter pass is the most expensive step of a run, and clicking "Generate Documents"
+    again for the same CP (e.g. to pick other documents) would otherwise repeat it. raw_data comes
+    from the cached _parse_cp_bytes, so identical uploads produce the same cache key. The client
+    itself is excluded from hashing; model_key identifies its settings instead.
+
+    Args:
+        raw_data (str): 
+            The trimmed Markdown text of the CP document.
+        model_key (str): 
+            A key describing the model client settings used for the extraction.
+        _model_client (OpenAIChatCompletionClient): 
+            The AI model client used for structured data extraction.
+
+    Returns:
+        dict: 
+            The structured course data. Streamlit hands every caller its own copy.
+
+    Raises:
+        Exception: 
+            If the model returned no usable content; failures are never cached.
+    """
+
+    context = run_async(interpret_cp(raw_data=raw_data, model_client=_model_client))
+    if not isinstance(context, dict):
+        raise Exception(context)
+    return context
+
+############################################################
+# 3. Generate Course Content
+############################################################
+# First number in a duration such as "40 hrs" or "16.5 hrs"
+DURATION_HOURS_PATTERN = re.compile(r"(\d+(?:\.\d+)?)")
+
+# Number of generated LG contents and timetables remembered per session
+CONTENT_CACHE_SIZE = 16
+
+async def generate_course_content(context: dict, generate_lg: bool, generate_ap: bool, needs_timetable: bool,
+                                  model_client: OpenAIChatCompletionClient,
+                                  timetable_model_client: OpenAIChatCompletionClient,
+                                  model_name: str, api_key: str, base_url: str) -> dict:
+    """
+    Runs the LLM-bound steps for the selected documents concurrently.
+
+    The Learning Guide content, the assessment evidence and the timetable only read the
+    course context, so their model calls are awaited together with `asyncio.gather`
+    instead of one after another. Rendering the documents is left to the caller.
+
+    The Learning Guide content and the timetable are built from a snapshot of the context
+    taken before the gather, and the assessment evidence is extracted into its own copy and
+    merged into `context` only after every step has finished, so no prompt depends on how
+    the steps happen to be scheduled.
+
+    The Learning Guide content and the timetable are remembered per session, keyed on the
+    model and the full course context, so generating again for the same CP (e.g. to add a
+    document that was left unticked) reuses them instead of repeating the model calls.
+
+    Args:
+        context (dict): 
+            The structured course data returned by interpret_cp.
+        generate_lg (bool): 
+            Whether to generate the Learning Guide content.
+        generate_ap (bool): 
+            Whether to extract the assessment evidence for the Assessment Plan.
+        needs_timetable (bool): 
+            Whether to generate the timetable used by the Lesson Plan and Facilitator's Guide.
+        model_client (OpenAIChatCompletionClient): 
+            The model client used for the Learning Guide content.
+        timetable_model_client (OpenAIChatCompletionClient): 
+            The model client used for timetable generation.
+        model_name (str): 
+            The model name used for assessment evidence extraction.
+        api_key (str): 
+            The API key used for assessment evidence extraction.
+        base_url (str): 
+            The base URL used for assessment evidence extraction.
+
+    Returns:
+        dict: 
+            Results keyed by "lg", "ap" and "timetable" for the steps that were run.
+            A step that failed maps to the exception it raised, so one failure does
+            not discard the other results.
+    """
+
+    # Every step reads this snapshot; nothing writes to `context` until the gather completes
+    snapshot = deepcopy(context)
+
+    async def build_timetable():
+        duration = snapshot["Total_Course_Duration_Hours"]
+        hours_match = DURATION_HOURS_PATTERN.search(duration)
+        if hours_match is None:
+            raise Exception(f"Could not read the course duration from '{duration}'")
+        hours = int(float(hours_match.group(1)))
+        num_of_days = hours / 8
+        return await generate_timetable(snapshot, num_of_days, timetable_model_client)
+
+    content_cache = st.session_state.setdefault('content_cache', {})
+    context_key = dumps_json(snapshot)
+
+    async def cached_step(step, coro):
+        cache_key = (step, model_name, base_url, context_key)
+        # Callers fold the result into their context, so only copies go in and out of the cache
+        if cache_key in content_cache:
+            coro.close()  # Never awaited on a cache hit
+            return deepcopy(content_cache[cache_key])
+        result = await coro
+        if result:  # Empty or unparseable replies are not remembered
+            content_cache[cache_key] = deepcopy(result)
+            while len(content_cache) > CONTENT_CACHE_SIZE:
+                content_cache.pop(next(iter(content_cache)))
+        return result
+
+    tasks = {}
+    if generate_lg:
+        tasks["lg"] = cached_step("lg", generate_content(snapshot, model_client))
+    if generate_ap:
+        # Reuse this session's evidence client so its connections are kept across runs
+        evidence_model_client = get_model_client(evidence_client_params(model_name, api_key, base_url))
+        tasks["ap"] = ensure_assessment_evidence(deepcopy(snapshot), model_client=evidence_model_client)
+    if needs_timetable:
+        tasks["timetable"] = cached_step("timetable", build_timetable())
+
+    results = dict(zip(tasks, await asyncio.gather(*tasks.values(), return_exceptions=True)))
+
+    # Merge the extracted evidence now that the other steps are done with the context
+    if isinstance(results.get("ap"), dict):
+        context["Assessment_Methods_Details"] = results["ap"].get("Assessment_Methods_Details", [])
+    return results
+
+async def render_documents(context: dict, name_of_organisation: str, render_lg: bool, render_ap: bool,
+                           render_lp: bool, render_fg: bool,
+                           model_name: str, api_key: str, base_url: str) -> dict:
+    """
+    Renders the selected courseware documents concurrently in worker threads.
+
+    Once generate_course_content has filled in the context, the documents no longer depend
+    on each other, so their template rendering and file writes run side by side instead of
+    one after another on the Streamlit script thread. Each render gets its own shallow copy
+    of the context because the generators set top-level keys such as "company_logo" for
+    their own template.
+
+    Args:
+        context (dict): 
+            The structured course data including the generated content and timetable.
+        name_of_organisation (str): 
+            The name of the organization, used for the logo and document details.
+        render_lg (bool): 
+            Whether to render the Learning Guide.
+        render_ap (bool): 
+            Whether to render the Assessment Plan and Assessment Summary Record.
+        render_lp (bool): 
+            Whether to render the Lesson Plan.
+        render_fg (bool): 
+            Whether to render the Facilitator's Guide.
+        model_name (str): 
+            The model name, passed on for any assessment evidence still missing.
+        api_key (str): 
+            The API key, passed on for any assessment evidence still missing.
+        base_url (str): 
+            The base URL, passed on for any assessment evidence still missing.
+
+    Returns:
+        dict: 
+            Results keyed by "lg", "ap", "lp" and "fg" for the documents that were rendered:
+            an output path, or an (AP path, ASR path) tuple for "ap". A render that failed
+            maps to the exception it raised.
+    """
+
+    tasks = {}
+    if render_lg:
+        tasks["lg"] = asyncio.to_thread(render_learning_guide, dict(context), name_of_organisation)
+    if render_ap:
+        tasks["ap"] = asyncio.to_thread(generate_assessment_documents, dict(context), name_of_organisation,
+                                        None, model_name, api_key, base_url)
+    if render_lp:
+        tasks["lp"] = asyncio.to_thread(generate_lesson_plan, dict(context), name_of_organisation)
+    if render_fg:
+        tasks["fg"] = asyncio.to_thread(generate_facilitators_guide, dict(context), name_of_organisation)
+
+    results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+    return dict(zip(tasks, results))
+
+############################################################
+# 4. Organisation Table
+############################################################
+# Rows of the organisation table built per rerun; only the current page gets widgets
+ORG_TABLE_PAGE_SIZE = 20
+
+@st.cache_data(show_spinner=False)
+def load_logo_bytes(logo_path: str, mtime: float) -> bytes:
+    """
+    Reads an organisation logo for display. The modification time is part of the cache key,
+    so a logo replaced on disk is read again while unchanged logos are served from memory.
+    """
+
+    with open(logo_path, "rb") as f:
+        return f.read()
+
+############################################################
+# 5. Document Downloads
+############################################################
+# Generated documents in the download ZIP: session state key and file name prefix
+ZIP_DOCUMENTS = (
+    ("lg_output", "LG"),
+    ("ap_output", "Assessment_Plan"),
+    ("asr_output", "Assessment_Summary_Record"),
+    ("lp_output", "LP"),
+    ("fg_output", "FG"),
+)
+
 # Streamlit App
 def app():
     """
@@ -482,13 +747,11 @@ def app():
     st.subheader("Step 2: Enter Relevant Details")
     tgs_course_code = st.text_input("Enter TGS Course Code", key="tgs_course_code", placeholder="e.g., TGS-2023039181")
 
-    # Load organisations from JSON using the utility function - cached
-    @st.cache_data
-    def get_cached_organizations():
-        return load_organizations()
-
-    org_list = get_cached_organizations()
-    org_names = [org["name"] for org in org_list] if org_list else []
+    # Load organisations from JSON using the utility function (cached until the file changes)
+    org_list = load_organizations()
+    org_names = [org["name"] for org in org_list]
+    # Built in reverse so that, as with a first-match scan, the first record wins on a duplicate name
+    org_by_name = {org["name"]: org for org in reversed(org_list)}
 
     # Get the company selected from sidebar (automatically use it)
     sidebar_selected_company = st.session_state.get('selected_company', None)
@@ -524,7 +787,7 @@ def app():
                         safe_filename = new_name.lower().replace(" ", "_") + ext
                         save_path = os.path.join("Courseware", "utils", "logo", safe_filename)
                         with open(save_path, "wb") as f:
-                            f.write(new_logo_file.getvalue())
+                            f.write(new_logo_file.getbuffer())
                         logo_path = save_path
                     new_org = Organization(name=new_name, uen=new_uen, logo=logo_path)
                     add_organization(new_org)
@@ -533,7 +796,7 @@ def app():
             
             # ---- Display Existing Organisations with Edit/Delete Buttons ----
             st.write("#### Existing Organisations")
-            org_list = load_organizations()  # Refresh the list
+            # org_list was loaded at the top of this run; every CRUD action reruns the script
 
             # Table header
             col_sno, col_name, col_uen, col_logo, col_edit, col_delete = st.columns([1, 3, 2, 2, 1, 2])
@@ -544,18 +807,34 @@ def app():
             col_edit.markdown("**Edit**")
             col_delete.markdown("**Delete**")
 
+            # Only the current page of organisations is turned into widgets. The page selector owns
+            # "org_page"; it is pulled back in range first in case a delete removed the last page.
+            page_count = max(1, (len(org_list) + ORG_TABLE_PAGE_SIZE - 1) // ORG_TABLE_PAGE_SIZE)
+            if st.session_state.get("org_page", 1) > page_count:
+                st.session_state["org_page"] = page_count
+            if page_count > 1:
+                org_page = st.number_input("Page", min_value=1, max_value=page_count, step=1, key="org_page")
+            else:
+                org_page = 1
+            page_start = (org_page - 1) * ORG_TABLE_PAGE_SIZE
+            page_orgs = org_list[page_start:page_start + ORG_TABLE_PAGE_SIZE]
+
+            # Stat each logo once per run; every CRUD action reruns the script, which refreshes this
+            logo_mtimes = {i: get_file_mtime(org["logo"]) for i, org in enumerate(page_orgs, start=page_start)}
+
             # Table rows
-            for display_idx, org in enumerate(org_list, start=1):
-                # The actual index in the list is display_idx - 1
-                real_index = display_idx - 1
+            for real_index, org in enumerate(page_orgs, start=page_start):
+                # SNo is 1-based across all pages
+                display_idx = real_index + 1
 
                 row_sno, row_name, row_uen, row_logo, row_edit, row_delete = st.columns([1, 3, 2, 2, 1, 2])
                 row_sno.write(display_idx)
                 row_name.write(org["name"])
                 row_uen.write(org["uen"])
                 
-                if org["logo"] and os.path.exists(org["logo"]):
-                    row_logo.image(org["logo"], width=70)
+                logo_mtime = logo_mtimes[real_index]
+                if logo_mtime is not None:
+                    row_logo.image(load_logo_bytes(org["logo"], logo_mtime), width=70)
                 else:
                     row_logo.write("No Logo")
 
@@ -564,7 +843,7 @@ def app():
                     st.session_state["org_edit_index"] = real_index
                     st.rerun()
                 if row_delete.button("Delete", key=f"delete_{display_idx}", type="primary"):
-                    if org["logo"] and os.path.exists(org["logo"]):
+                    if logo_mtime is not None:
                         os.remove(org["logo"])
                     delete_organization(real_index)
                     st.success(f"Organisation '{org['name']}' deleted.")
@@ -573,7 +852,7 @@ def app():
             # ---- Edit Organisation Form (if a row is selected for editing) ----
             if "org_edit_index" in st.session_state:
                 edit_index = st.session_state["org_edit_index"]
-                org_to_edit = load_organizations()[edit_index]
+                org_to_edit = org_list[edit_index]
                 st.write(f"#### Edit Organisation: {org_to_edit['name']}")
                 with st.form("edit_org_form"):
                     edited_name = st.text_input("Organisation Name", value=org_to_edit["name"], key="edited_name")
@@ -588,7 +867,7 @@ def app():
                             safe_filename = edited_name.lower().replace(" ", "_") + ext
                             save_path = os.path.join("Courseware", "utils", "logo", safe_filename)
                             with open(save_path, "wb") as f:
-                                f.write(edited_logo_file.getvalue())
+                                f.write(edited_logo_file.getbuffer())
                             logo_path = save_path
                         updated_org = Organization(name=edited_name, uen=edited_uen, logo=logo_path)
                         update_organization(edit_index, updated_org)
@@ -666,16 +945,16 @@ def app():
             struct_client_kwargs = base_client_kwargs.copy()
             if cp_response_format is not None:
                 struct_client_kwargs["response_format"] = cp_response_format
-            openai_struct_model_client = OpenAIChatCompletionClient(**struct_client_kwargs)
+            openai_struct_model_client = get_model_client(struct_client_kwargs)
 
             # Create timetable client with response_format only if not None
             timetable_client_kwargs = base_client_kwargs.copy()
             if lp_response_format is not None:
                 timetable_client_kwargs["response_format"] = lp_response_format
-            timetable_openai_struct_model_client = OpenAIChatCompletionClient(**timetable_client_kwargs)
+            timetable_openai_struct_model_client = get_model_client(timetable_client_kwargs)
 
             # Create standard client without response_format
-            openai_model_client = OpenAIChatCompletionClient(**base_client_kwargs)
+            openai_model_client = get_model_client(base_client_kwargs)
 
             # Step 1: Parse the CP document
             try:
@@ -687,7 +966,7 @@ def app():
             
             try:
                 with st.spinner('Extracting Information from Course Proposal...'):
-                    context = asyncio.run(interpret_cp(raw_data=raw_data, model_client=openai_struct_model_client))
+                    context = interpret_cp_cached(raw_data, repr(sorted(struct_client_kwargs.items())), openai_struct_model_client)
 
             except Exception as e:
                 st.error(f"Error extracting Course Proposal: {e}")
@@ -696,13 +975,13 @@ def app():
             # After obtaining the context
             if context:
                 # Step 2: Add the current date to the raw_data
+                # This is the only clock read for the run: every document takes "Date" and "Year"
+                # from the context, so all outputs of one click carry the same date
                 current_datetime = datetime.now()
-                current_date = current_datetime.strftime("%d %b %Y")
-                year = current_datetime.year
-                context["Date"] = current_date
-                context["Year"] = year
+                context["Date"] = current_datetime.strftime("%d %b %Y")
+                context["Year"] = current_datetime.year
                 # Find the selected organisation UEN in the organisation's record
-                selected_org_data = next((org for org in org_list if org["name"] == selected_org), None)
+                selected_org_data = org_by_name.get(selected_org)
                 if selected_org_data:
                     context["UEN"] = selected_org_data["uen"]
 
@@ -711,22 +990,80 @@ def app():
 
                 st.session_state['context'] = context  # Store context in session state
 
-                # Generate Learning Guide
+                # Check if any documents require the timetable
+                needs_timetable = (generate_lp or generate_fg) and 'lesson_plan' not in context
+
+                # Run the model calls for all selected documents at once
+                with st.spinner('Generating course content...'):
+                    content_results = run_async(generate_course_content(
+                        context, generate_lg, generate_ap, needs_timetable,
+                        openai_model_client, timetable_openai_struct_model_client,
+                        model_name, api_key, base_url
+                    ))
+
+                # Fold the generated content into the context; a failed step skips its documents
+                render_lg = render_ap = False
                 if generate_lg:
                     try:
-                        with st.spinner('Generating Learning Guide...'):
-                            lg_output = generate_learning_guide(context, selected_org, openai_model_client)
+                        content_response = content_results["lg"]
+                        if isinstance(content_response, Exception):
+                            raise content_response
+                        if not content_response:
+                            # generate_content returns None when the reply has no parseable JSON
+                            raise Exception("No Learning Guide content could be parsed from the model response")
+                        context["Course_Overview"] = content_response.get("Course_Overview")
+                        context["LO_Description"] = content_response.get("LO_Description")
+                        render_lg = True
+                    except Exception as e:
+                        st.error(f"Error generating Learning Guide: {e}")
+
+                if generate_ap:
+                    if isinstance(content_results["ap"], Exception):
+                        st.error(f"Error generating Assessment Documents: {content_results['ap']}")
+                    else:
+                        render_ap = True
+
+                # Attach the timetable if it was generated
+                timetable_ready = True
+                if needs_timetable:
+                    try:
+                        timetable_data = content_results["timetable"]
+                        if isinstance(timetable_data, Exception):
+                            raise timetable_data
+                        context['lesson_plan'] = timetable_data['lesson_plan']
+                        st.session_state['context'] = context  # Update context in session state
+                    except Exception as e:
+                        st.error(f"Error generating timetable: {e}")
+                        timetable_ready = False  # Lesson Plan and Facilitator's Guide need the timetable
+
+                # Render all selected documents together
+                with st.spinner('Generating documents...'):
+                    render_results = run_async(render_documents(
+                        context, selected_org,
+                        render_lg, render_ap,
+                        generate_lp and timetable_ready, generate_fg and timetable_ready,
+                        model_name, api_key, base_url
+                    ))
+
+                # Learning Guide
+                if "lg" in render_results:
+                    try:
+                        lg_output = render_results["lg"]
+                        if isinstance(lg_output, Exception):
+                            raise lg_output
                         if lg_output:
                             st.success(f"Learning Guide generated: {lg_output}")
                             st.session_state['lg_output'] = lg_output  # Store output path in session state
                     except Exception as e:
                         st.error(f"Error generating Learning Guide: {e}")
 
-                # Generate Assessment Plan
-                if generate_ap:
+                # Assessment Plan and Assessment Summary Record
+                if "ap" in render_results:
                     try:
-                        with st.spinner('Generating Assessment Plan and Assessment Summary Record...'):
-                            ap_output, asr_output = generate_assessment_documents(context, selected_org, None, model_name, api_key, base_url)
+                        ap_result = render_results["ap"]
+                        if isinstance(ap_result, Exception):
+                            raise ap_result
+                        ap_output, asr_output = ap_result
                         
                         if ap_output:
                             st.success(f"Assessment Plan generated: {ap_output}")
@@ -739,27 +1076,12 @@ def app():
                     except Exception as e:
                         st.error(f"Error generating Assessment Documents: {e}")
 
-                # Check if any documents require the timetable
-                needs_timetable = (generate_lp or generate_fg)
-
-                # Generate the timetable if needed and not already generated
-                if needs_timetable and 'lesson_plan' not in context:
-                    try:
-                        with st.spinner("Generating Timetable..."):
-                            hours = int(''.join(filter(str.isdigit, context["Total_Course_Duration_Hours"])))
-                            num_of_days = hours / 8
-                            timetable_data = asyncio.run(generate_timetable(context, num_of_days, timetable_openai_struct_model_client))
-                            context['lesson_plan'] = timetable_data['lesson_plan']
-                        st.session_state['context'] = context  # Update context in session state
-                    except Exception as e:
-                        st.error(f"Error generating timetable: {e}")
-                        return  # Exit if timetable generation fails
-                    
-                # Now generate Lesson Plan
-                if generate_lp:
+                # Lesson Plan
+                if "lp" in render_results:
                     try:
-                        with st.spinner("Generating Lesson Plan..."):
-                            lp_output = generate_lesson_plan(context, selected_org)
+                        lp_output = render_results["lp"]
+                        if isinstance(lp_output, Exception):
+                            raise lp_output
                         if lp_output:
                             st.success(f"Lesson Plan generated: {lp_output}")
                             st.session_state['lp_output'] = lp_output  # Store output path in session state
@@ -767,11 +1089,12 @@ def app():
                     except Exception as e:
                         st.error(f"Error generating Lesson Plan: {e}")
 
-                # Generate Facilitator's Guide
-                if generate_fg:
+                # Facilitator's Guide
+                if "fg" in render_results:
                     try:
-                        with st.spinner("Generating Facilitator's Guide..."):
-                            fg_output = generate_facilitators_guide(context, selected_org)
+                        fg_output = render_results["fg"]
+                        if isinstance(fg_output, Exception):
+                            raise fg_output
                         if fg_output:
                             st.success(f"Facilitator's Guide generated: {fg_output}")
                             st.session_state['fg_output'] = fg_output  # Store output path in session state
@@ -784,43 +1107,28 @@ def app():
             st.error("Please upload a CP document and select a Name of Organisation.")
 
     # Check if any courseware document was generated
-    if any([
-        st.session_state.get('lg_output'),
-        st.session_state.get('ap_output'),
-        st.session_state.get('asr_output'),
-        st.session_state.get('lp_output'),
-        st.session_state.get('fg_output')
-    ]):
+    if any(st.session_state.get(output_key) for output_key, _ in ZIP_DOCUMENTS):
         st.subheader("Download All Generated Documents as ZIP")
 
-        # Create an in-memory ZIP file
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
-            
-            # Helper function to add a file to the zip archive
-            def add_file(file_path, prefix):
-                if file_path and os.path.exists(file_path):
-                    # Determine file name based on TGS_Ref_No (if available) or fallback to course title
-                    if 'TGS_Ref_No' in st.session_state['context'] and st.session_state['context']['TGS_Ref_No']:
-                        file_name = f"{prefix}_{st.session_state['context']['TGS_Ref_No']}_{st.session_state['context']['Course_Title']}_v1.docx"
-                    else:
-                        file_name = f"{prefix}_{st.session_state['context']['Course_Title']}_v1.docx"
-                    zipf.write(file_path, arcname=file_name)
-            
-            # Add each generated document if it exists
-            add_file(st.session_state.get('lg_output'), "LG")
-            add_file(st.session_state.get('ap_output'), "Assessment_Plan")
-            add_file(st.session_state.get('asr_output'), "Assessment_Summary_Record")
-            add_file(st.session_state.get('lp_output'), "LP")
-            add_file(st.session_state.get('fg_output'), "FG")
-        
-        # Reset the buffer's position to the beginning
-        zip_buffer.seek(0)
-        
+        # Determine file names based on TGS_Ref_No (if available) or fallback to course title
+        course_context = st.session_state['context']
+        if course_context.get('TGS_Ref_No'):
+            name_suffix = f"{course_context['TGS_Ref_No']}_{course_context['Course_Title']}_v1.docx"
+        else:
+            name_suffix = f"{course_context['Course_Title']}_v1.docx"
+
+        # Collect each generated document that exists; the archive itself is only built on click
+        documents = []
+        for output_key, prefix in ZIP_DOCUMENTS:
+            file_path = st.session_state.get(output_key)
+            file_mtime = get_file_mtime(file_path)
+            if file_mtime is not None:
+                documents.append((file_path, f"{prefix}_{name_suffix}", file_mtime))
+
         # Create a download button for the ZIP archive
         st.download_button(
             label="Download All Documents (ZIP)",
-            data=zip_buffer.getvalue(),
+            data=partial(build_documents_zip, tuple(documents)),
             file_name="courseware_documents.zip",
             mime="application/zip"
         )
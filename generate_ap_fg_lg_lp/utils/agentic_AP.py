@@ -23,6 +23,11 @@ Main Functionalities:
     • is_evidence_extracted(context):
           Checks whether all required evidence fields (evidence, submission, marking process,
           and retention period) are already present for each assessment method.
+    • evidence_client_params(model_name=None, api_key=None, base_url=None):
+          Returns the model client settings for evidence extraction, so callers can reuse a cached client.
+    • ensure_assessment_evidence(context, model_name=None, api_key=None, base_url=None, model_client=None):
+          Awaitable step that extracts and merges any missing assessment evidence, so callers can
+          run it alongside other LLM calls before rendering the documents.
     • generate_assessment_plan(context, name_of_organisation, sfw_dataset_dir):
           Populates an Assessment Plan DOCX template with the course and assessment evidence data,
           integrates the organization's logo, and returns the path to the generated document.
@@ -39,7 +44,7 @@ Dependencies:
     - Pydantic: For modeling assessment method data.
     - Autogen AgentChat and OpenAIChatCompletionClient: For generating structured evidence using AI.
     - DocxTemplate (from docxtpl): For rendering DOCX templates.
-    - Custom Helper Functions: retrieve_excel_data and process_logo_image from generate_ap_fg_lg_lp/utils/helper.
+    - Custom Helper Functions: retrieve_excel_data, process_logo_image and load_docx_template from generate_ap_fg_lg_lp/utils/helper.
 
 Usage:
     - Ensure that all necessary API keys and configurations are set in st.secrets.
@@ -65,8 +70,8 @@ from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.messages import TextMessage
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 from autogen_core import CancellationToken
-from docxtpl import DocxTemplate
-from generate_ap_fg_lg_lp.utils.helper import retrieve_excel_data, process_logo_image
+from generate_ap_fg_lg_lp.utils.helper import retrieve_excel_data, process_logo_image, load_docx_template
+from common.common import loads_json
 
 class AssessmentMethod(BaseModel):
     evidence: Union[str, List[str]]
@@ -259,7 +264,7 @@ async def extract_assessment_evidence(structured_data, model_client):
     response_content = response.chat_message.content
     try:
         # First try to parse as direct JSON (for structured output)
-        evidence_data = json.loads(response_content)
+        evidence_data = loads_json(response_content)
     except json.JSONDecodeError:
         # If that fails, try to extract JSON from markdown code block
         from common.common import parse_json_content
@@ -364,6 +369,112 @@ def is_evidence_extracted(context):
                 return False
     return True
 
+def evidence_client_params(model_name=None, api_key=None, base_url=None) -> dict:
+    """
+    Returns the OpenAIChatCompletionClient keyword arguments used for assessment evidence extraction.
+
+    Args:
+        model_name (str, optional): 
+            The AI model name to use. Falls back to the GPT-4o-Mini configuration if not provided.
+        api_key (str, optional): 
+            The API key for the AI model.
+        base_url (str, optional): 
+            The base URL of the model provider (needed for Gemini models).
+
+    Returns:
+        dict: 
+            Client keyword arguments configured for structured evidence output where the model supports it.
+    """
+
+    # Use the configured model system instead of direct API access
+    from settings.model_configs import get_model_config
+    
+    if model_name and api_key:
+        # Use provided model parameters with proper model_info
+        client_params = {
+            "model": model_name,
+            "temperature": 0,
+            "api_key": api_key,
+            "model_info": {
+                "family": "openai" if "gpt" in model_name.lower() else "unknown",
+                "function_calling": True if "gpt" in model_name.lower() else False,
+                "json_output": True,
+                "vision": False
+            }
+        }
+        # Add base_url if provided (needed for Gemini models)
+        if base_url:
+            client_params["base_url"] = base_url
+        # Only add response_format for OpenAI models
+        if "gpt" in model_name.lower():
+            client_params["response_format"] = EvidenceGatheringPlan
+        return client_params
+
+    # Use default model configuration for assessment generation
+    config = get_model_config("GPT-4o-Mini")
+    client_params = {
+        "model": config["config"]["model"],
+        "temperature": 0,
+        "api_key": config["config"]["api_key"],
+        "model_info": config["config"]["model_info"]
+    }
+    # Only add response_format for OpenAI models
+    model_family = config["config"]["model_info"].get("family", "unknown")
+    if model_family == "openai":
+        client_params["response_format"] = EvidenceGatheringPlan
+    return client_params
+
+def build_evidence_model_client(model_name=None, api_key=None, base_url=None) -> OpenAIChatCompletionClient:
+    """
+    Creates the model client used for assessment evidence extraction.
+
+    Args:
+        model_name (str, optional): 
+            The AI model name to use. Falls back to the GPT-4o-Mini configuration if not provided.
+        api_key (str, optional): 
+            The API key for the AI model.
+        base_url (str, optional): 
+            The base URL of the model provider (needed for Gemini models).
+
+    Returns:
+        OpenAIChatCompletionClient: 
+            A client configured for structured evidence output where the model supports it.
+    """
+
+    return OpenAIChatCompletionClient(**evidence_client_params(model_name, api_key, base_url))
+
+async def ensure_assessment_evidence(context: dict, model_name=None, api_key=None, base_url=None, model_client=None) -> dict:
+    """
+    Extracts any missing assessment evidence and merges it into the course context.
+
+    Args:
+        context (dict): 
+            The structured course data including assessment methods.
+        model_name (str, optional): 
+            The AI model name to use for evidence extraction.
+        api_key (str, optional): 
+            The API key for the AI model.
+        base_url (str, optional): 
+            The base URL of the model provider.
+        model_client (OpenAIChatCompletionClient, optional): 
+            An existing evidence client to reuse, so its open connections are shared with the
+            caller's other requests. Built from the other arguments if not provided.
+
+    Returns:
+        dict: 
+            The course context with evidence details under "Assessment_Methods_Details".
+    """
+
+    if is_evidence_extracted(context):
+        print("Skipping assessment evidence extraction as all required fields are already present.")
+        return context
+
+    print("Extracting missing assessment evidence...")
+    if model_client is None:
+        model_client = build_evidence_model_client(model_name, api_key, base_url)
+    evidence = await extract_assessment_evidence(structured_data=context, model_client=model_client)
+    return combine_assessment_methods(context, evidence)
+
 def generate_assessment_plan(context: dict, name_of_organisation, sfw_dataset_dir, model_name=None, api_key=None, base_url=None) -> str:
     """
     Generates an Assessment Plan (AP) document by populating a DOCX template with course assessment details.
@@ -397,52 +508,11 @@ def generate_assessment_plan(context: dict, name_of_organisation, sfw_dataset_di
     """
 
     if not is_evidence_extracted(context):
-        print("Extracting missing assessment evidence...")
-
-        # Use the configured model system instead of direct API access
-        from settings.model_configs import get_model_config
-        
-        if model_name and api_key:
-            # Use provided model parameters with proper model_info
-            client_params = {
-                "model": model_name,
-                "temperature": 0,
-                "api_key": api_key,
-                "model_info": {
-                    "family": "openai" if "gpt" in model_name.lower() else "unknown",
-                    "function_calling": True if "gpt" in model_name.lower() else False,
-                    "json_output": True,
-                    "vision": False
-                }
-            }
-            # Add base_url if provided (needed for Gemini models)
-            if base_url:
-                client_params["base_url"] = base_url
-            # Only add response_format for OpenAI models
-            if "gpt" in model_name.lower():
-                client_params["response_format"] = EvidenceGatheringPlan
-            evidence_model_client = OpenAIChatCompletionClient(**client_params)
-        else:
-            # Use default model configuration for assessment generation
-            config = get_model_config("GPT-4o-Mini")
-            client_params = {
-                "model": config["config"]["model"],
-                "temperature": 0,
-                "api_key": config["config"]["api_key"],
-                "model_info": config["config"]["model_info"]
-            }
-            # Only add response_format for OpenAI models
-            model_family = config["config"]["model_info"].get("family", "unknown")
-            if model_family == "openai":
-                client_params["response_format"] = EvidenceGatheringPlan
-            evidence_model_client = OpenAIChatCompletionClient(**client_params)
-
-        evidence = asyncio.run(extract_assessment_evidence(structured_data=context, model_client=evidence_model_client))
-        context = combine_assessment_methods(context, evidence)
+        context = asyncio.run(ensure_assessment_evidence(context, model_name, api_key, base_url))
     else:
         print("Skipping assessment evidence extraction as all required fields are already present.")
 
-    doc = DocxTemplate(AP_TEMPLATE_DIR)
+    doc = load_docx_template(AP_TEMPLATE_DIR)
 
     context = retrieve_excel_data(context, sfw_dataset_dir)
 
@@ -482,7 +552,7 @@ def generate_asr_document(context: dict, name_of_organisation) -> str:
             If there are issues with reading/writing the document.
     """
 
-    doc = DocxTemplate(ASR_TEMPLATE_DIR)
+    doc = load_docx_template(ASR_TEMPLATE_DIR)
     context['Name_of_Organisation'] = name_of_organisation
 
     doc.render(context)
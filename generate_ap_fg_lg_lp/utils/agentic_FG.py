@@ -22,7 +22,7 @@ Dependencies:
     - External Libraries:
          • docxtpl (DocxTemplate) – For rendering DOCX templates.
     - Custom Utilities:
-         • retrieve_excel_data, process_logo_image from generate_ap_fg_lg_lp/utils/helper
+         • retrieve_excel_data, process_logo_image, load_docx_template from generate_ap_fg_lg_lp/utils/helper
 
 Usage:
     - Ensure that the FG DOCX template and the Excel dataset file are available at the specified locations.
@@ -39,8 +39,7 @@ Date:
 """
 
 import tempfile
-from docxtpl import DocxTemplate
-from generate_ap_fg_lg_lp.utils.helper import retrieve_excel_data, process_logo_image
+from generate_ap_fg_lg_lp.utils.helper import retrieve_excel_data, process_logo_image, load_docx_template
 
 FG_TEMPLATE_DIR = "generate_ap_fg_lg_lp/input/Template/FG_TGS-Ref-No_Course-Title_v1.docx"  
     
@@ -80,7 +79,7 @@ def generate_facilitators_guide(context: dict, name_of_organisation: str, sfw_da
     sfw_dataset_dir = "generate_ap_fg_lg_lp/input/dataset/Sfw_dataset-2022-03-30 copy.xlsx"
     context = retrieve_excel_data(context, sfw_dataset_dir)
 
-    doc = DocxTemplate(FG_TEMPLATE_DIR)
+    doc = load_docx_template(FG_TEMPLATE_DIR)
     
     # Add the logo to the context
     context['company_logo'] = process_logo_image(doc, name_of_organisation)
@@ -18,6 +18,8 @@ Main Functionalities:
     • generate_learning_guide(context, name_of_organisation, model_client):
           Retrieves the AI-generated content, integrates it into a DOCX template, inserts the organization's logo,
           renders the document, and saves it as a temporary file. Returns the file path of the generated Learning Guide.
+    • render_learning_guide(context, name_of_organisation):
+          Renders the Learning Guide template from a context that already holds the generated content.
 
 Dependencies:
     - Standard Libraries: json, tempfile, asyncio
@@ -28,7 +30,7 @@ Dependencies:
          • docxtpl (DocxTemplate)
     - Custom Utilities:
          • parse_json_content from utils.helper
-         • process_logo_image from generate_ap_fg_lg_lp/utils/helper
+         • process_logo_image, load_docx_template from generate_ap_fg_lg_lp/utils/helper
 
 Usage:
     - Ensure the Learning Guide DOCX template and organization logo are available at the specified paths.
@@ -49,9 +51,8 @@ import asyncio
 from autogen_agentchat.agents import AssistantAgent
 from autogen_core import CancellationToken
 from autogen_agentchat.messages import TextMessage
-from docxtpl import DocxTemplate
 from common.common import parse_json_content
-from generate_ap_fg_lg_lp.utils.helper import process_logo_image
+from generate_ap_fg_lg_lp.utils.helper import process_logo_image, load_docx_template
 
 LG_TEMPLATE_DIR = "generate_ap_fg_lg_lp/input/Template/LG_TGS-Ref-No_Course-Title_v1.docx"  
 
@@ -139,6 +140,36 @@ async def generate_content(context, model_client):
         print(f"Error parsing LG content JSON: {e}")
     return context
 
+def render_learning_guide(context: dict, name_of_organisation: str) -> str:
+    """
+    Renders the Learning Guide DOCX template from a context that already contains
+    `"Course_Overview"` and `"LO_Description"`.
+
+    Args:
+        context (dict): 
+            A dictionary containing course details and the generated Learning Guide content.
+        name_of_organisation (str): 
+            The name of the organization, used to retrieve and insert the corresponding logo.
+
+    Returns:
+        str: 
+            The file path of the generated Learning Guide document.
+    """
+
+    doc = load_docx_template(LG_TEMPLATE_DIR)
+
+    # Add the logo to the context
+    context['company_logo'] = process_logo_image(doc, name_of_organisation)
+    context['Name_of_Organisation'] = name_of_organisation
+
+    doc.render(context, autoescape=True)
+    # Use a temporary file to save the document
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".docx") as tmp_file:
+        doc.save(tmp_file.name)
+        output_path = tmp_file.name  # Get the path to the temporary file
+
+    return output_path  # Return the path to the temporary file
+
 def generate_learning_guide(context: dict, name_of_organisation: str, model_client) -> str:
     """
     Generates a Learning Guide document by populating a DOCX template with course content.
@@ -171,16 +202,4 @@ def generate_learning_guide(context: dict, name_of_organisation: str, model_clie
     context["Course_Overview"] = content_response.get("Course_Overview") 
     context["LO_Description"] = content_response.get("LO_Description") 
 
-    doc = DocxTemplate(LG_TEMPLATE_DIR)
-
-    # Add the logo to the context
-    context['company_logo'] = process_logo_image(doc, name_of_organisation)
-    context['Name_of_Organisation'] = name_of_organisation
-
-    doc.render(context, autoescape=True)
-    # Use a temporary file to save the document
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".docx") as tmp_file:
-        doc.save(tmp_file.name)
-        output_path = tmp_file.name  # Get the path to the temporary file
-
-    return output_path  # Return the path to the temporary file
\ No newline at end of file
+    return render_learning_guide(context, name_of_organisation)
@@ -24,6 +24,7 @@ Dependencies:
          • docxtpl (DocxTemplate) – For rendering DOCX templates.
     - Custom Utilities:
          • process_logo_image from generate_ap_fg_lg_lp/utils/helper – For processing and embedding the organization's logo.
+         • load_docx_template from generate_ap_fg_lg_lp/utils/helper – For loading the cached Lesson Plan template.
 
 Usage:
     - Ensure the Lesson Plan DOCX template is available at the specified path.
@@ -39,8 +40,7 @@ Date:
 """
 
 import tempfile
-from docxtpl import DocxTemplate
-from generate_ap_fg_lg_lp.utils.helper import process_logo_image
+from generate_ap_fg_lg_lp.utils.helper import process_logo_image, load_docx_template
 
 LP_TEMPLATE_DIR = "generate_ap_fg_lg_lp/input/Template/LP_TGS-Ref-No_Course-Title_v1.docx" 
 
@@ -70,7 +70,7 @@ def generate_lesson_plan(context: dict, name_of_organisation: str) -> str:
             If there are issues with reading/writing the document.
     """
     
-    doc = DocxTemplate(LP_TEMPLATE_DIR)
+    doc = load_docx_template(LP_TEMPLATE_DIR)
 
     # Add the logo to the context
     context['company_logo'] = process_logo_image(doc, name_of_organisation)
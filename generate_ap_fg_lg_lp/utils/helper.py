@@ -21,13 +21,15 @@ Main Functionalities:
     • process_logo_image(doc, name_of_organisation, max_width_inch=7, max_height_inch=2.5) -> InlineImage:
           - Processes and resizes the organization's logo image to fit within the defined maximum dimensions.
           - Returns an InlineImage object for insertion into DOCX templates using docxtpl.
+    • load_docx_template(template_path: str) -> DocxTemplate:
+          - Returns a fresh DocxTemplate built from template bytes that are read from disk only once per process.
 
 Dependencies:
     - pandas: For reading and parsing Excel files.
-    - os: For file system operations.
+    - os, io, functools: For file system operations and in-memory template caching.
     - PIL (Pillow): For image processing.
     - docx.shared.Inches: For specifying dimensions in Word documents.
-    - docxtpl.InlineImage: For embedding images into DOCX templates.
+    - docxtpl.InlineImage, docxtpl.DocxTemplate: For embedding images into and loading DOCX templates.
 
 Usage:
     - Import the helper functions when additional course data or logo processing is required.
@@ -45,11 +47,13 @@ Date:
 
 import pandas as pd
 import os
+import io
 import tempfile
 import requests
+from functools import lru_cache
 from PIL import Image
 from docx.shared import Inches
-from docxtpl import InlineImage
+from docxtpl import DocxTemplate, InlineImage
 
 def retrieve_excel_data(context: dict, sfw_dataset_dir: str) -> dict:
     """
@@ -106,6 +110,27 @@ def retrieve_excel_data(context: dict, sfw_dataset_dir: str) -> dict:
     # Return the retrieved data as a dictionary
     return context
 
+@lru_cache(maxsize=8)
+def _read_template_bytes(template_path: str) -> bytes:
+    """Read a DOCX template from disk once and keep its raw bytes for reuse"""
+    with open(template_path, "rb") as f:
+        return f.read()
+
+def load_docx_template(template_path: str) -> DocxTemplate:
+    """
+    Load a DOCX template for rendering, reusing the template bytes cached in memory.
+
+    A new in-memory stream is created on every call, so each returned DocxTemplate can be
+    rendered and saved independently without re-reading the template file from disk.
+
+    Args:
+        template_path (str): The file path of the DOCX template.
+
+    Returns:
+        DocxTemplate: A fresh template instance ready to be rendered.
+    """
+    return DocxTemplate(io.BytesIO(_read_template_bytes(template_path)))
+
 def _download_logo_from_url(url: str) -> str:
     """Download logo from URL to a temp file and return the path"""
     try:
@@ -194,10 +219,8 @@ def process_logo_image(doc, name_of_organisation, max_width_inch=7, max_height_i
         width_inch = width_px / dpi[0]
         height_inch = height_px / dpi[1]
 
-        # Scale dimensions if they exceed the maximum
-        width_ratio = max_width_inch / width_inch if width_inch > max_width_inch else 1
-        height_ratio = max_height_inch / height_inch if height_inch > max_height_inch else 1
-        scaling_factor = min(width_ratio, height_ratio)
+        # Scale down to fit within the maximum dimensions (never scale up)
+        scaling_factor = min(1.0, max_width_inch / width_inch, max_height_inch / height_inch)
 
         # Apply scaling
         width_docx = Inches(width_inch * scaling_factor)
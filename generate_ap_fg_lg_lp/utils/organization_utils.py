@@ -13,10 +13,16 @@ Description:
 Main Functionalities:
     • Organization (BaseModel):
           A Pydantic model representing an organization with fields for name, UEN, and an optional logo.
+          Used to validate form input before a record is added or updated.
+    • OrgDict (TypedDict):
+          The plain dictionary shape of a stored organization record. Records are loaded, listed and
+          saved as OrgDicts, so rendering the organization table involves no model validation.
     • load_organizations():
-          Reads and returns the list of organization records from a JSON file.
+          Returns the list of organization records from the JSON file. The parsed records are cached
+          in memory and only re-read when the file's modification time changes.
     • save_organizations(org_list):
-          Saves the provided list of organization records to the JSON file with proper indentation.
+          Atomically saves the provided list of organization records to the JSON file with proper
+          indentation and refreshes the in-memory cache.
     • add_organization(org):
           Appends a new organization to the existing list and saves the updated list.
     • update_organization(index, org):
@@ -25,7 +31,7 @@ Main Functionalities:
           Removes the organization record at the specified index from the list and saves the updated list.
 
 Dependencies:
-    - Standard Libraries: json, os, typing (Optional)
+    - Standard Libraries: json, os, tempfile, typing (Optional, TypedDict)
     - Pydantic: For data validation and model creation.
 
 Usage:
@@ -44,7 +50,8 @@ Date:
 
 import json
 import os
-from typing import Optional
+import tempfile
+from typing import Optional, TypedDict
 from pydantic import BaseModel
 
 ORG_FILE = "generate_ap_fg_lg_lp/utils/organizations.json"
@@ -54,27 +61,56 @@ class Organization(BaseModel):
     uen: str
     logo: Optional[str] = None
 
-def load_organizations():
-    if os.path.exists(ORG_FILE):
+# Stored organization records are internal plain dicts; Organization is only the input gate
+class OrgDict(TypedDict):
+    name: str
+    uen: str
+    logo: Optional[str]
+
+# Parsed contents of ORG_FILE and the modification time they were read at
+_org_cache = {"mtime": None, "orgs": []}
+
+def load_organizations() -> list[OrgDict]:
+    try:
+        mtime = os.path.getmtime(ORG_FILE)
+    except OSError:
+        return []
+    if _org_cache["mtime"] != mtime:
         with open(ORG_FILE, "r") as f:
-            return json.load(f)
-    return []
+            _org_cache["orgs"] = json.load(f)
+        _org_cache["mtime"] = mtime
+    # Hand out copies so callers can modify the list without touching the cache
+    return [dict(org) for org in _org_cache["orgs"]]
+
+def save_organizations(org_list: list[OrgDict]):
+    # Each save writes its own temporary file next to ORG_FILE, so concurrent saves never
+    # share a temp file, and the rename swaps the complete file in at once
+    fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(ORG_FILE), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(org_list, f, indent=4)
+        os.chmod(tmp_file, 0o644)  # mkstemp creates the file owner-only
+        os.replace(tmp_file, ORG_FILE)
+    except BaseException:
+        os.remove(tmp_file)
+        raise
+    _org_cache["orgs"] = [dict(org) for org in org_list]
+    _org_cache["mtime"] = os.path.getmtime(ORG_FILE)
 
-def save_organizations(org_list):
-    with open(ORG_FILE, "w") as f:
-        json.dump(org_list, f, indent=4)
+def _to_org_dict(org: Organization) -> OrgDict:
+    return OrgDict(name=org.name, uen=org.uen, logo=org.logo)
 
-def add_organization(org):
+def add_organization(org: Organization):
     org_list = load_organizations()
-    org_list.append(org.dict())
+    org_list.append(_to_org_dict(org))
     save_organizations(org_list)
 
-def update_organization(index, org):
+def update_organization(index: int, org: Organization):
     org_list = load_organizations()
-    org_list[index] = org.dict()
+    org_list[index] = _to_org_dict(org)
     save_organizations(org_list)
 
-def delete_organization(index):
+def delete_organization(index: int):
     org_list = load_organizations()
     org_list.pop(index)
     save_organizations(org_list)
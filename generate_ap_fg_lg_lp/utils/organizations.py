@@ -11,10 +11,16 @@ Supports both:
 
 import json
 import os
+import threading
 from typing import List, Dict, Any, Optional
 
 ORGANIZATIONS_FILE = "generate_ap_fg_lg_lp/utils/organizations.json"
 
+# settings.neon_client shares one lazily created psycopg2 connection across the process.
+# Documents are rendered in worker threads that each look up the organisation logo, so
+# every Neon call below holds this lock to keep those threads off the connection at once.
+_NEON_LOCK = threading.Lock()
+
 # Try to import Neon client
 try:
     from settings.neon_client import (
@@ -85,9 +91,10 @@ def _convert_to_neon_format(org: Dict[str, Any]) -> Dict[str, Any]:
 def get_organizations_from_neon() -> List[Dict[str, Any]]:
     """Load organizations from Neon PostgreSQL"""
     try:
-        # Initialize table if needed
-        init_organizations_table()
-        rows = neon_get_all()
+        with _NEON_LOCK:
+            # Initialize table if needed
+            init_organizations_table()
+            rows = neon_get_all()
         organizations = [_convert_neon_org(row) for row in rows]
         return organizations
     except Exception as e:
@@ -125,7 +132,8 @@ def save_organization_to_neon(org: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         data = _convert_to_neon_format(org)
         # Always use upsert to handle both insert and update cases
         # This works even when the local data doesn't have the database ID
-        result = neon_upsert(data)
+        with _NEON_LOCK:
+            result = neon_upsert(data)
 
         if result:
             return _convert_neon_org(result)
@@ -163,7 +171,8 @@ def save_organizations(organizations: List[Dict[str, Any]]) -> bool:
 def delete_organization_from_neon(org_id: int) -> bool:
     """Delete organization from Neon by ID"""
     try:
-        return neon_delete(org_id)
+        with _NEON_LOCK:
+            return neon_delete(org_id)
     except Exception as e:
         print(f"Error deleting from Neon: {e}")
         return False
@@ -49,6 +49,13 @@ from common.common import parse_json_content
 import asyncio
 import time
 
+# Instructional method names as they appear in CPs, mapped to the names used in valid IM pairs
+IM_REPLACEMENTS = {
+    "Classroom": "Lecture",
+    "Practical": "Practice",
+    "Discussion": "Group Discussion",
+}
+
 def extract_unique_instructional_methods(course_context):
     """
     Extracts and processes unique instructional method combinations from the provided course context.
@@ -87,21 +94,13 @@ def extract_unique_instructional_methods(course_context):
         extracted_methods = lu.get("Instructional_Methods", [])
 
         # Fix replacements BEFORE grouping
-        corrected_methods = []
-        for method in extracted_methods:
-            if method == "Classroom":
-                corrected_methods.append("Lecture")
-            elif method == "Practical":
-                corrected_methods.append("Practice")
-            elif method == "Discussion":
-                corrected_methods.append("Group Discussion")
-            else:
-                corrected_methods.append(method)
+        corrected_methods = [IM_REPLACEMENTS.get(method, method) for method in extracted_methods]
+        corrected_method_set = set(corrected_methods)
 
         # Generate valid IM pairs from the extracted methods
         method_pairs = set()
         for pair in valid_im_pairs:
-            if all(method in corrected_methods for method in pair):
+            if corrected_method_set.issuperset(pair):
                 method_pairs.add(", ".join(pair))  # Convert tuple to a string
 
         # If no valid pairs were found, create custom pairings
@@ -121,40 +120,9 @@ def extract_unique_instructional_methods(course_context):
 
     return unique_methods
 
-async def generate_timetable(context, num_of_days, model_client):
-    """
-    Generates a structured lesson plan timetable based on the provided course context.
-
-    This function uses an AI assistant agent to create a timetable that adheres to WSQ course structure rules.
-    It ensures balanced topic distribution across the specified number of days, maintains session timing integrity,
-    and applies predefined instructional methods.
-
-    Args:
-        context (dict): 
-            A dictionary containing course details, including Learning Units, Learning Outcomes, 
-            and Assessment Methods.
-        num_of_days (int): 
-            The number of days over which the course timetable should be distributed.
-        model_client: 
-            An AI model client instance used to generate the lesson plan.
-
-    Returns:
-        dict: 
-            A dictionary containing the generated lesson plan under the key `"lesson_plan"`, 
-            structured as a list of sessions for each day.
-
-    Raises:
-        Exception:
-            If the generated timetable response is missing the required `"lesson_plan"` key or 
-            fails to parse correctly.
-    """
-    
-    list_of_im = extract_unique_instructional_methods(context)
-
-    timetable_generator_agent = AssistantAgent(
-        name="Timetable_Generator",
-        model_client=model_client,
-        system_message=f"""
+# System prompt for the timetable agent. Only the number of days and the instructional methods
+# vary between calls, so they are filled in with str.format; literal braces are doubled.
+TIMETABLE_SYSTEM_MESSAGE_TEMPLATE = """
             You are a timetable generator for WSQ courses.
             Your task is to create a **detailed and structured lesson plan timetable** for a WSQ course based on the provided course information and context. **Every generated timetable must strictly follow the rules below to maintain quality and accuracy.**
 
@@ -311,6 +279,41 @@ async def generate_timetable(context, num_of_days, model_client):
             All timings must be consecutive without gaps or overlaps.
             The total number of days in the timetable must match {num_of_days}.
             """
+
+async def generate_timetable(context, num_of_days, model_client):
+    """
+    Generates a structured lesson plan timetable based on the provided course context.
+
+    This function uses an AI assistant agent to create a timetable that adheres to WSQ course structure rules.
+    It ensures balanced topic distribution across the specified number of days, maintains session timing integrity,
+    and applies predefined instructional methods.
+
+    Args:
+        context (dict): 
+            A dictionary containing course details, including Learning Units, Learning Outcomes, 
+            and Assessment Methods.
+        num_of_days (int): 
+            The number of days over which the course timetable should be distributed.
+        model_client: 
+            An AI model client instance used to generate the lesson plan.
+
+    Returns:
+        dict: 
+            A dictionary containing the generated lesson plan under the key `"lesson_plan"`, 
+            structured as a list of sessions for each day.
+
+    Raises:
+        Exception:
+            If the generated timetable response is missing the required `"lesson_plan"` key or 
+            fails to parse correctly.
+    """
+    
+    list_of_im = extract_unique_instructional_methods(context)
+
+    timetable_generator_agent = AssistantAgent(
+        name="Timetable_Generator",
+        model_client=model_client,
+        system_message=TIMETABLE_SYSTEM_MESSAGE_TEMPLATE.format(num_of_days=num_of_days, list_of_im=list_of_im)
     )
 
     agent_task = f"""
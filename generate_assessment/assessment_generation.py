@@ -58,7 +58,7 @@ Main Functionalities:
 
 Dependencies:
     - Core Libraries:
-        • os, io, zipfile, tempfile, json, asyncio, copy (deepcopy)
+        • os, tempfile, json, asyncio, copy (deepcopy), functools (partial)
     - Streamlit:
         • streamlit (for building the web application interface)
     - PDF and Document Parsing:
@@ -103,13 +103,12 @@ Notes:
 import streamlit as st
 import nest_asyncio
 import os
-import io
-import zipfile
 import asyncio
 import json
 import pymupdf
 import tempfile
 from copy import deepcopy
+from functools import partial
 from llama_index.llms.openai import OpenAI as llama_openai
 from llama_index.core import (
     Settings,
@@ -133,7 +132,8 @@ from settings.model_configs import get_model_config
 from settings.api_manager import get_all_available_models
 from settings.api_manager import load_api_keys
 from autogen_ext.models.openai import OpenAIChatCompletionClient
-from common.common import parse_json_content
+from common.common import parse_json_content, loads_json, get_file_mtime
+from common.streamlit_utils import run_async, get_model_client, build_documents_zip
 
 ################################################################################
 # Initialize session_state keys at the top of the script.
@@ -239,7 +239,7 @@ def extract_master_k_a_list(fg_markdown):
 
     # Parse JSON to extract all text content from pages
     try:
-        fg_json = json.loads(fg_markdown)
+        fg_json = loads_json(fg_markdown)
         all_text = ""
 
         # Extract text from all pages
@@ -706,13 +706,13 @@ def app():
 
     # Test API connection before proceeding
     try:
-        test_client = OpenAIChatCompletionClient(
+        test_client = get_model_client(dict(
             model=model_name,
             api_key=api_key,
             temperature=temperature,
             base_url=base_url,
             model_info=model_info,
-        )
+        ))
         
     except Exception as e:
         st.error(f"❌ Failed to create API client: {e}")
@@ -724,23 +724,25 @@ def app():
             st.error("🌐 **Network Issue**: Cannot connect to API service")
         return
 
-    structured_model_client = OpenAIChatCompletionClient(
+    # Clients are reused across reruns of this session (get_model_client), so their
+    # connections stay open on the session's event loop instead of piling up per rerun
+    structured_model_client = get_model_client(dict(
         model=model_name,
         api_key=api_key,
         temperature=temperature,
         base_url=base_url,
         model_info=model_info,
         max_tokens=16384,  # Increased for FG parsing (needs to extract full course structure)
-    )
+    ))
 
-    model_client = OpenAIChatCompletionClient(
+    model_client = get_model_client(dict(
         model=model_name,
         api_key=api_key,
         temperature=temperature,
         base_url=base_url,
         model_info=model_info,
         max_tokens=4096,
-    )
+    ))
 
     fg_doc_file = st.file_uploader("Upload Facilitator Guide (.docx)", type=["docx"])
 
@@ -759,8 +761,8 @@ def app():
 
                 if os.path.exists(interp_cache_path):
                     print(f"✅ Found cached FG interpretation")
-                    with open(interp_cache_path, 'r', encoding='utf-8') as f:
-                        interpreted_data = json.load(f)
+                    with open(interp_cache_path, 'rb') as f:
+                        interpreted_data = loads_json(f.read())
 
                     # Apply filter to cached data too (in case cache was created before filter was added)
                     if "assessments" in interpreted_data and isinstance(interpreted_data["assessments"], list):
@@ -791,7 +793,7 @@ def app():
                             print(f"✅ Filtered {original_count - len(filtered_assessments)} suspicious assessment(s) from cache")
                 else:
                     print(f"⏳ Interpreting FG with LLM (this may take 10-30 seconds)...")
-                    interpreted_data = asyncio.run(interpret_fg(fg_data, structured_model_client))
+                    interpreted_data = run_async(interpret_fg(fg_data, structured_model_client))
 
                     # Validate and filter hallucinated assessments
                     if "assessments" in interpreted_data and isinstance(interpreted_data["assessments"], list):
@@ -950,17 +952,17 @@ def app():
                             try:
                                 if assessment_type == "WA (SAQ)":
                                     with st.spinner(f"Auto-generating Written Assessment (SAQ)... (attempt {attempt + 1}/{max_retries})"):
-                                        saq_context = asyncio.run(generate_saq(st.session_state['fg_data'], index, model_client))
+                                        saq_context = run_async(generate_saq(st.session_state['fg_data'], index, model_client))
                                         files = generate_documents(saq_context, assessment_type, "output")
                                         st.session_state['assessment_generated_files'][assessment_type] = files
                                 elif assessment_type == "PP":
                                     with st.spinner(f"Auto-generating Practical Performance... (attempt {attempt + 1}/{max_retries})"):
-                                        pp_context = asyncio.run(generate_pp(st.session_state['fg_data'], index, model_client))
+                                        pp_context = run_async(generate_pp(st.session_state['fg_data'], index, model_client))
                                         files = generate_documents(pp_context, assessment_type, "output")
                                         st.session_state['assessment_generated_files'][assessment_type] = files
                                 elif assessment_type == "CS":
                                     with st.spinner(f"Auto-generating Case Study... (attempt {attempt + 1}/{max_retries})"):
-                                        cs_context = asyncio.run(generate_cs(st.session_state['fg_data'], index, model_client))
+                                        cs_context = run_async(generate_cs(st.session_state['fg_data'], index, model_client))
                                         files = generate_documents(cs_context, assessment_type, "output")
                                         st.session_state['assessment_generated_files'][assessment_type] = files
                                 break  # Success, exit retry loop
@@ -1027,17 +1029,17 @@ def app():
                             try:
                                 if assessment_type == "WA (SAQ)":
                                     with st.spinner(f"Generating Written Assessment (SAQ)... (attempt {attempt + 1}/{max_retries})"):
-                                        saq_context = asyncio.run(generate_saq(st.session_state['fg_data'], index, model_client))
+                                        saq_context = run_async(generate_saq(st.session_state['fg_data'], index, model_client))
                                         files = generate_documents(saq_context, assessment_type, "output")
                                         st.session_state['assessment_generated_files'][assessment_type] = files
                                 elif assessment_type == "PP":
                                     with st.spinner(f"Generating Practical Performance... (attempt {attempt + 1}/{max_retries})"):
-                                        pp_context = asyncio.run(generate_pp(st.session_state['fg_data'], index, model_client))
+                                        pp_context = run_async(generate_pp(st.session_state['fg_data'], index, model_client))
                                         files = generate_documents(pp_context, assessment_type, "output")
                                         st.session_state['assessment_generated_files'][assessment_type] = files
                                 elif assessment_type == "CS":
                                     with st.spinner(f"Generating Case Study... (attempt {attempt + 1}/{max_retries})"):
-                                        cs_context = asyncio.run(generate_cs(st.session_state['fg_data'], index, model_client))
+                                        cs_context = run_async(generate_cs(st.session_state['fg_data'], index, model_client))
                                         files = generate_documents(cs_context, assessment_type, "output")
                                         st.session_state['assessment_generated_files'][assessment_type] = files
                                 break  # Success, exit retry loop
@@ -1065,38 +1067,28 @@ def app():
                     st.error(f"Error generating assessments: {e}")
 
     generated_files = st.session_state.get('assessment_generated_files', {})
-    # Check if any assessment type has a valid QUESTION or ANSWER file
-    if generated_files and any(
-        ((file_paths.get('QUESTION') and os.path.exists(file_paths.get('QUESTION'))) or 
-        (file_paths.get('ANSWER') and os.path.exists(file_paths.get('ANSWER'))))
-        for file_paths in generated_files.values()
-    ):
-        course_title = "Course Title"
-        # If fg_data is available, update course_title accordingly.
-        if st.session_state.get('fg_data'):
-            course_title = st.session_state['fg_data'].get("course_title", "Course Title")
-        
-        # Create an in-memory ZIP file containing all available assessment documents.
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
-            for assessment_type, file_paths in generated_files.items():
-                q_path = file_paths.get('QUESTION')
-                a_path = file_paths.get('ANSWER')
-                
-                if q_path and os.path.exists(q_path):
-                    q_file_name = f"{assessment_type} - {course_title}.docx"
-                    zipf.write(q_path, arcname=q_file_name)
-                
-                if a_path and os.path.exists(a_path):
-                    a_file_name = f"Answer to {assessment_type} - {course_title}.docx"
-                    zipf.write(a_path, arcname=a_file_name)
-        
-        # Reset the buffer's position to the beginning
-        zip_buffer.seek(0)
-        
+    course_title = "Course Title"
+    # If fg_data is available, update course_title accordingly.
+    if st.session_state.get('fg_data'):
+        course_title = st.session_state['fg_data'].get("course_title", "Course Title")
+
+    # Collect each QUESTION and ANSWER file that exists; the archive itself is only built on click
+    documents = []
+    for assessment_type, file_paths in generated_files.items():
+        q_path = file_paths.get('QUESTION')
+        q_mtime = get_file_mtime(q_path)
+        if q_mtime is not None:
+            documents.append((q_path, f"{assessment_type} - {course_title}.docx", q_mtime))
+
+        a_path = file_paths.get('ANSWER')
+        a_mtime = get_file_mtime(a_path)
+        if a_mtime is not None:
+            documents.append((a_path, f"Answer to {assessment_type} - {course_title}.docx", a_mtime))
+
+    if documents:
         st.download_button(
             label="Download All Assessments (ZIP)",
-            data=zip_buffer.getvalue(),
+            data=partial(build_documents_zip, tuple(documents)),
             file_name="assessments.zip",
             mime="application/zip"
         )
@@ -24,6 +24,9 @@ import streamlit as st
 from bs4 import BeautifulSoup
 from pydantic import BaseModel
 
+# Local imports
+from generate_brochure_v2.driver_pool import DriverPool
+
 # Optional imports with fallbacks
 try:
     from playwright.sync_api import sync_playwright
@@ -39,10 +42,6 @@ except ImportError:
 
 try:
     from selenium import webdriver
-    from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.support.ui import WebDriverWait
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
@@ -64,6 +63,9 @@ except ImportError:
 
 TEMPLATE_ASSET_DIR = (Path(__file__).resolve().parent / "brochure_template").resolve()
 
+# BeautifulSoup backend for scraped course pages; lxml's C parser is much faster than html.parser
+HTML_PARSER = "lxml"
+
 TSC_CODE_FRAMEWORK_MAPPING = {
     'AGR': 'Agriculture',
     'BCA': 'Built Environment',
@@ -211,10 +213,18 @@ def create_default_course_data(url: str = "") -> CourseData:
 # WEB SCRAPING FUNCTIONS
 # =============================================================================
 
+# Headless Chrome instances reused across scrapes (see driver_pool)
+_CHROME_POOL = DriverPool(lambda options: webdriver.Chrome(options=options))
+
+
 def scrape_with_browserless(url: str) -> BeautifulSoup:
     """
     Scrape URL using Selenium with Chrome options.
 
+    Reuses pooled headless Chrome instances instead of launching one per call.
+    A stale instance is replaced and the page load retried once; a driver that
+    errors out is discarded so the next call starts fresh.
+
     Args:
         url: URL to scrape
 
@@ -224,26 +234,8 @@ def scrape_with_browserless(url: str) -> BeautifulSoup:
     Raises:
         Exception: If scraping fails
     """
-    options = Options()
-    options.add_argument('--headless')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--disable-gpu')
-    options.add_argument('--window-size=1920,1080')
-
-    driver = webdriver.Chrome(options=options)
-
-    try:
-        driver.get(url)
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-
-        html_content = driver.page_source
-        return BeautifulSoup(html_content, 'html.parser')
-
-    finally:
-        driver.quit()
+    html_content = _CHROME_POOL.fetch_page_source(url)
+    return BeautifulSoup(html_content, HTML_PARSER)
 
 
 def scrape_with_requests(url: str) -> BeautifulSoup:
@@ -266,7 +258,7 @@ def scrape_with_requests(url: str) -> BeautifulSoup:
     response = requests.get(url, headers=headers, timeout=30)
     response.raise_for_status()
 
-    return BeautifulSoup(response.content, 'html.parser')
+    return BeautifulSoup(response.content, HTML_PARSER)
 
 
 def web_scrape_course_info(url: str) -> CourseData:
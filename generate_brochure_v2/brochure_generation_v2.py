@@ -11,6 +11,7 @@ Description:
 
 Main Functionalities:
     • web_scrape_course_info(url): Scrapes course information from URL
+    • scrape_course_data(url): Cached browser scrape of a course page, reused for a day per URL
     • populate_brochure_template(course_data): Fills template with scraped data
     • generate_brochure_outputs(html_content, course_title): Creates PDF and Word outputs
     • app(): Streamlit web interface for the brochure generation process
@@ -39,6 +40,7 @@ import re
 from datetime import datetime
 from typing import List, Dict
 from pydantic import BaseModel
+from generate_brochure_v2.driver_pool import DriverPool
 
 # Data models matching original structure
 class CourseTopic(BaseModel):
@@ -80,10 +82,6 @@ except ImportError:
 
 try:
     from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.chrome.options import Options
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
@@ -105,6 +103,9 @@ except ImportError:
 # Base directory for brochure template assets (e.g., images)
 TEMPLATE_ASSET_DIR = (Path(__file__).resolve().parent / "brochure_template").resolve()
 
+# BeautifulSoup backend for scraped course pages; lxml's C parser is much faster than html.parser
+HTML_PARSER = "lxml"
+
 # Helper for xhtml2pdf to resolve relative asset URIs (e.g., images) to filesystem paths
 def _xhtml2pdf_link_callback(uri, rel):
     try:
@@ -120,6 +121,87 @@ def _xhtml2pdf_link_callback(uri, rel):
 
 
 
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def scrape_course_data(url: str) -> CourseData:
+    """
+    Scrape and extract course information from the provided URL with the browserless service.
+
+    Results are cached per URL for a day, so regenerating a brochure for the same
+    course skips the browser round-trip. Only browser scrapes are cached: a failed
+    scrape raises, and the requests fallback in web_scrape_course_info runs outside
+    this function, so its incomplete result for a client-rendered page is not kept.
+    
+    Args:
+        url (str): The URL to scrape course information from
+        
+    Returns:
+        CourseData: Extracted course information
+    """
+    return extract_course_data(scrape_with_browserless(url), url)
+
+
+def scrape_with_requests(url: str):
+    """
+    Fetch a page with requests, without running its scripts.
+    
+    Args:
+        url (str): URL to fetch
+        
+    Returns:
+        BeautifulSoup: Parsed HTML content
+    """
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    }
+    
+    response = requests.get(url, headers=headers, timeout=30)
+    response.raise_for_status()
+    
+    return BeautifulSoup(response.content, HTML_PARSER)
+
+
+def extract_course_data(soup, url: str) -> CourseData:
+    """
+    Extract course information from a parsed course page.
+    
+    Args:
+        soup (BeautifulSoup): Parsed course page
+        url (str): The URL the page was loaded from
+        
+    Returns:
+        CourseData: Extracted course information
+    """
+    # Extract TSC code first to determine correct framework
+    tsc_code = extract_tsc_code(soup)
+
+    # Try to extract framework directly from text first, fallback to mapping
+    extracted_framework = extract_tsc_framework(soup)
+    if extracted_framework != "Not Applicable":
+        framework = extracted_framework
+    else:
+        framework = get_framework_from_tsc_code(tsc_code)
+
+    # Extract data in original format structure
+    course_data = CourseData(
+        course_title=extract_course_title_wsq_format(soup),
+        course_description=extract_course_description_paragraphs(soup),
+        learning_outcomes=extract_learning_outcomes_list(soup),
+        tsc_title=extract_tsc_title(soup),
+        tsc_code=tsc_code,
+        tsc_framework=framework,  # Use extracted framework or fallback to mapping
+        wsq_funding=extract_wsq_funding_table(soup),
+        tgs_reference_no=extract_tgs_reference_number(soup),
+        gst_exclusive_price=extract_fee_before_gst_format(soup),
+        gst_inclusive_price=extract_fee_with_gst_format(soup),
+        session_days=extract_session_days(soup),
+        duration_hrs=extract_duration_hrs(soup),
+        course_details_topics=extract_course_topics_with_subtopics(soup),
+        course_url=url
+    )
+    
+    return course_data
+
+
 def web_scrape_course_info(url: str) -> CourseData:
     """
     Web scrape course information from the provided URL using browserless service.
@@ -132,48 +214,12 @@ def web_scrape_course_info(url: str) -> CourseData:
     """
     try:
         if SELENIUM_AVAILABLE:  # Re-enable browserless for better scraping
-            # Use browserless service for web scraping
-            soup = scrape_with_browserless(url)
-        else:
-            # Use requests as fallback
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Extract TSC code first to determine correct framework
-        tsc_code = extract_tsc_code(soup)
-
-        # Try to extract framework directly from text first, fallback to mapping
-        extracted_framework = extract_tsc_framework(soup)
-        if extracted_framework != "Not Applicable":
-            framework = extracted_framework
-        else:
-            framework = get_framework_from_tsc_code(tsc_code)
-
-        # Extract data in original format structure
-        course_data = CourseData(
-            course_title=extract_course_title_wsq_format(soup),
-            course_description=extract_course_description_paragraphs(soup),
-            learning_outcomes=extract_learning_outcomes_list(soup),
-            tsc_title=extract_tsc_title(soup),
-            tsc_code=tsc_code,
-            tsc_framework=framework,  # Use extracted framework or fallback to mapping
-            wsq_funding=extract_wsq_funding_table(soup),
-            tgs_reference_no=extract_tgs_reference_number(soup),
-            gst_exclusive_price=extract_fee_before_gst_format(soup),
-            gst_inclusive_price=extract_fee_with_gst_format(soup),
-            session_days=extract_session_days(soup),
-            duration_hrs=extract_duration_hrs(soup),
-            course_details_topics=extract_course_topics_with_subtopics(soup),
-            course_url=url
-        )
-        
-        return course_data
+            try:
+                return scrape_course_data(url)
+            except Exception as e:
+                st.warning(f"Browserless scraping failed: {e}. Falling back to requests.")
+        # Use requests as fallback
+        return extract_course_data(scrape_with_requests(url), url)
         
     except Exception as e:
         st.error(f"Error scraping URL: {e}")
@@ -207,74 +253,65 @@ def web_scrape_course_info(url: str) -> CourseData:
         )
 
 
+def _create_remote_driver(chrome_options):
+    """
+    Open a new browserless session. Used by the driver pool for each scrape.
+    
+    Args:
+        chrome_options: Chrome options from driver_pool.chrome_options()
+    
+    Returns:
+        webdriver.Remote: Browser session connected to the browserless service
+    
+    Raises:
+        Exception: If the browserless endpoint is not configured
+    """
+    # Get browserless configuration from Streamlit secrets
+    browserless_endpoint = st.secrets.get("BROWSER_WEBDRIVER_ENDPOINT", "")
+    browserless_token = st.secrets.get("BROWSER_TOKEN", "")
+    
+    if not browserless_endpoint:
+        raise Exception("BROWSER_WEBDRIVER_ENDPOINT not configured in secrets")
+    
+    # Add token to browserless endpoint if available
+    if browserless_token and not browserless_endpoint.endswith('/webdriver'):
+        if '?' in browserless_endpoint:
+            browserless_endpoint = f"{browserless_endpoint}&token={browserless_token}"
+        else:
+            browserless_endpoint = f"{browserless_endpoint}?token={browserless_token}"
+    
+    # Initialize remote WebDriver
+    return webdriver.Remote(
+        command_executor=browserless_endpoint,
+        options=chrome_options
+    )
+
+
+# Browserless sessions for scrapes (see driver_pool). Each open session occupies a
+# concurrent-session slot on the service, so sessions are closed after every scrape
+# instead of being kept idle.
+_REMOTE_POOL = DriverPool(_create_remote_driver, keep_idle=False)
+
+
 def scrape_with_browserless(url: str):
     """
     Scrape website using browserless service with Selenium.
+
+    Scrapes from different sessions run in parallel, each on its own remote
+    browser session, up to the pool size.
     
     Args:
         url (str): URL to scrape
         
     Returns:
         BeautifulSoup: Parsed HTML content
-    """
-    try:
-        # Get browserless configuration from Streamlit secrets
-        browserless_endpoint = st.secrets.get("BROWSER_WEBDRIVER_ENDPOINT", "")
-        browserless_token = st.secrets.get("BROWSER_TOKEN", "")
         
-        if not browserless_endpoint:
-            raise Exception("BROWSER_WEBDRIVER_ENDPOINT not configured in secrets")
-        
-        # Set up Chrome options for browserless
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        
-        # Add token to browserless endpoint if available
-        if browserless_token and not browserless_endpoint.endswith('/webdriver'):
-            if '?' in browserless_endpoint:
-                browserless_endpoint = f"{browserless_endpoint}&token={browserless_token}"
-            else:
-                browserless_endpoint = f"{browserless_endpoint}?token={browserless_token}"
-        
-        # Initialize remote WebDriver
-        driver = webdriver.Remote(
-            command_executor=browserless_endpoint,
-            options=chrome_options
-        )
-        
-        try:
-            # Navigate to the URL
-            driver.get(url)
-            
-            # Wait for page to load
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            # Get page source and parse with BeautifulSoup
-            html_content = driver.page_source
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            return soup
-            
-        finally:
-            driver.quit()
-            
-    except Exception as e:
-        st.warning(f"Browserless scraping failed: {e}. Falling back to requests.")
-        # Fallback to requests
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        return BeautifulSoup(response.content, 'html.parser')
+    Raises:
+        Exception: If the browser session fails; callers fall back to requests
+    """
+    # Get page source and parse with BeautifulSoup
+    html_content = _REMOTE_POOL.fetch_page_source(url)
+    return BeautifulSoup(html_content, HTML_PARSER)
 
 
 def extract_course_title_wsq_format(soup):
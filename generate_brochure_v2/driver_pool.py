@@ -0,0 +1,156 @@
+"""
+Shared Selenium Driver Pool
+
+Keeps a small pool of browser sessions for scraping course pages, so concurrent
+scrapes from different Streamlit sessions run side by side, and holds the Chrome
+options and page-load logic used by both brochure generators so they only need
+to be changed in one place.
+
+Date: 16 October 2026
+"""
+
+import atexit
+import threading
+from typing import Callable
+
+try:
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    SELENIUM_AVAILABLE = False
+
+# Maximum number of browser sessions a pool runs at the same time
+DRIVER_POOL_SIZE = 3
+
+# An idle browser session is reused across scrapes and recycled after this many page loads
+DRIVER_MAX_USES = 50
+
+# Chrome flags for headless scraping. Only the page text is scraped, so image
+# downloads and extension loading are skipped.
+CHROME_ARGUMENTS = (
+    '--headless',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--window-size=1920,1080',
+    '--blink-settings=imagesEnabled=false',
+    '--disable-extensions',
+)
+
+
+def chrome_options() -> "Options":
+    """
+    Build the Chrome options used for scraping course pages.
+
+    Returns:
+        Options: Chrome options with CHROME_ARGUMENTS applied
+    """
+    options = Options()
+    for argument in CHROME_ARGUMENTS:
+        options.add_argument(argument)
+    return options
+
+
+def _quit_driver(driver) -> None:
+    """Shut down a driver, ignoring errors from sessions that are already gone."""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class DriverPool:
+    """
+    Up to `max_drivers` WebDrivers shared by concurrent scrapes.
+
+    With keep_idle=True a finished driver is kept for the next scrape until it has
+    loaded `max_uses` pages; with keep_idle=False every scrape gets a fresh driver
+    that is shut down afterwards (for remote sessions that occupy a paid slot while
+    open). Idle drivers are shut down when the process exits.
+    """
+
+    def __init__(self, create_driver: Callable, max_drivers: int = DRIVER_POOL_SIZE,
+                 max_uses: int = DRIVER_MAX_USES, keep_idle: bool = True):
+        """
+        Args:
+            create_driver: Called with chrome_options() to start a new driver
+            max_drivers: Maximum number of drivers open at the same time
+            max_uses: Page loads after which an idle driver is replaced
+            keep_idle: Whether finished drivers are kept for the next scrape
+        """
+        self._create_driver = create_driver
+        self.max_uses = max_uses
+        self.keep_idle = keep_idle
+        self._slots = threading.BoundedSemaphore(max_drivers)
+        self._idle_lock = threading.Lock()
+        self._idle = []  # (driver, page loads so far)
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        """Shut down every idle driver."""
+        with self._idle_lock:
+            idle, self._idle = self._idle, []
+        for driver, _ in idle:
+            _quit_driver(driver)
+
+    def _acquire(self):
+        """Take a free slot and return an idle (driver, uses) pair or a new driver."""
+        self._slots.acquire()
+        with self._idle_lock:
+            if self._idle:
+                return self._idle.pop()
+        try:
+            return self._create_driver(chrome_options()), 0
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _release(self, driver, uses: int, healthy: bool) -> None:
+        """Return a driver to the idle list, or shut it down, and free its slot."""
+        try:
+            if healthy and self.keep_idle and uses < self.max_uses:
+                with self._idle_lock:
+                    self._idle.append((driver, uses))
+            else:
+                _quit_driver(driver)
+        finally:
+            self._slots.release()
+
+    def fetch_page_source(self, url: str, timeout: int = 10) -> str:
+        """
+        Load a URL in a pooled browser and return its page source.
+
+        A reused session that fails to load the page may have been closed by the
+        browser or the service, so the load is retried once on a fresh driver.
+        A driver that errors out is shut down rather than returned to the pool.
+
+        Args:
+            url: URL to load
+            timeout: Seconds to wait for the page body
+
+        Returns:
+            HTML of the loaded page
+        """
+        driver, uses = self._acquire()
+        healthy = False
+        try:
+            try:
+                driver.get(url)
+            except Exception:
+                if uses == 0:
+                    raise
+                _quit_driver(driver)
+                driver, uses = self._create_driver(chrome_options()), 0
+                driver.get(url)
+
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            )
+            page_source = driver.page_source
+            healthy = True
+            return page_source
+        finally:
+            self._release(driver, uses + 1, healthy)
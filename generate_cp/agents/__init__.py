@@ -0,0 +1,5 @@
+from dotenv import load_dotenv
+
+# Load .env once per process when the agents package is first imported,
+# rather than from each agent module.
+load_dotenv(override=False)
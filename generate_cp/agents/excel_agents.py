@@ -4,7 +4,6 @@ from autogen_agentchat.teams import RoundRobinGroupChat
 import json
 import asyncio
 import os
-from dotenv import load_dotenv
 from settings.model_configs import get_model_config
 from autogen_agentchat.ui import Console
 
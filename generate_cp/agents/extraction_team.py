@@ -1,11 +1,8 @@
 from autogen_core.models import ChatCompletionClient
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.teams import RoundRobinGroupChat
-from dotenv import load_dotenv
 from settings.model_configs import get_model_config
 
-load_dotenv()
-
 
 def extraction_task(data):
     extraction_task = f"""
@@ -3,14 +3,11 @@ from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.teams import RoundRobinGroupChat
 import json
 import os
-from dotenv import load_dotenv
 import asyncio
 from generate_cp.utils.helpers import extract_final_agent_json
 from autogen_agentchat.messages import TextMessage
 from settings.model_configs import get_model_config
 
-load_dotenv()
-
 def justification_task(ensemble_output):
     justification_task = f"""
     1. Based on the extracted data from {ensemble_output}, generate your justifications.
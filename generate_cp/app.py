@@ -1,7 +1,9 @@
 # app.py
 import streamlit as st
 import os
+import shutil
 import tempfile
+from functools import partial
 from generate_cp.main import main
 import asyncio
 from generate_cp.utils.document_parser import parse_document
@@ -17,6 +19,46 @@ if 'cv_output_files' not in st.session_state:
 if 'selected_model' not in st.session_state:
     st.session_state['selected_model'] = "GPT-4o-Mini"
 
+# MIME types of the generated files, by extension
+OUTPUT_MIME_TYPES = {
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.doc': 'application/msword',
+    '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    '.xls': 'application/vnd.ms-excel',
+}
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def read_output_file(path: str, mtime: float) -> bytes:
+    """
+    Reads a generated file for download. Passed to st.download_button as deferred data,
+    so the file is only read when its button is clicked, not on every rerun. The
+    modification time is part of the cache key, so repeated downloads are served from
+    memory until the pipeline rewrites the file.
+    """
+    with open(path, 'rb') as f:
+        return f.read()
+
+def output_download_button(output_file, label: str) -> bool:
+    """
+    Shows a download button for a generated file stored as {'path', 'name'} in session state.
+    Returns False, without showing anything, if there is no such file.
+    """
+    if not output_file:
+        return False
+    # A single stat both checks that the file exists and gives the cache key
+    try:
+        mtime = os.path.getmtime(output_file['path'])
+    except OSError:
+        return False
+    _, ext = os.path.splitext(output_file['name'])
+    st.download_button(
+        label=label,
+        data=partial(read_output_file, output_file['path'], mtime),
+        file_name=output_file['name'],
+        mime=OUTPUT_MIME_TYPES.get(ext, 'application/octet-stream')
+    )
+    return True
+
 def app():
     st.title("📄 Course Proposal File Processor")
     
@@ -76,16 +118,14 @@ def app():
     if uploaded_file is not None:
         st.success(f"Uploaded file: {uploaded_file.name}")
 
-        # 1) Save the uploaded file to a temporary location
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".docx") as tmp_input:
-            tmp_input.write(uploaded_file.getbuffer())
-            input_tsc_path = tmp_input.name
+        # 1) Keep the upload in memory; the parser reads it straight from bytes
+        input_tsc = uploaded_file.getvalue()
 
         # 2) Process button
         if st.button("🚀 Process File"):
             # Optional: parse_document before the main pipeline if you want:
-            # parse_document(input_tsc_path, "json_output/output_TSC_TEST.json")
-            run_processing(input_tsc_path)
+            # parse_document(input_tsc, "json_output/output_TSC_TEST.json")
+            run_processing(input_tsc)
             st.session_state['processing_done'] = True
 
         # 3) Display download buttons after processing
@@ -99,45 +139,12 @@ def app():
             file_downloads = st.session_state.get('file_downloads', {})
             
             # Display CP Word document
-            cp_docx = file_downloads.get('cp_docx')
             if cp_type == "Old CP":
-                if cp_docx and os.path.exists(cp_docx['path']):
-                    with open(cp_docx['path'], 'rb') as f:
-                        data = f.read()
-                    # Determine MIME type based on file extension
-                    if cp_docx['name'].endswith('.docx'):
-                        mime_type = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-                    else:
-                        mime_type = 'application/octet-stream'
-                    
-                    st.download_button(
-                        label="📄 Download CP Document",
-                        data=data,
-                        file_name=cp_docx['name'],
-                        mime=mime_type
-                    )
+                output_download_button(file_downloads.get('cp_docx'), "📄 Download CP Document")
             
             # Display Excel file for New CP
             if cp_type == "New CP":
-                excel_file = file_downloads.get('excel')
-                if excel_file and os.path.exists(excel_file['path']):
-                    with open(excel_file['path'], 'rb') as f:
-                        data = f.read()
-                    # Determine MIME type based on file extension
-                    if excel_file['name'].endswith('.xlsx'):
-                        mime_type = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-                    elif excel_file['name'].endswith('.xls'):
-                        mime_type = 'application/vnd.ms-excel'
-                    else:
-                        mime_type = 'application/octet-stream'
-                    
-                    st.download_button(
-                        label="📊 Download CP Excel",
-                        data=data,
-                        file_name=excel_file['name'],
-                        mime=mime_type
-                    )
-                elif cp_type == "New CP":
+                if not output_download_button(file_downloads.get('excel'), "📊 Download CP Excel"):
                     st.warning("Excel file was not generated. This may be normal if processing was interrupted.")
             
             # Display CV validation documents
@@ -148,38 +155,16 @@ def app():
                 # Use columns to organize multiple download buttons
                 cols = st.columns(min(3, len(cv_docs)))
                 for idx, doc in enumerate(cv_docs):
-                    if os.path.exists(doc['path']):
-                        with open(doc['path'], 'rb') as f:
-                            data = f.read()
-                        
-                        # Extract name from the filename (e.g. extract "Bernard" from "CP_validation_template_bernard_updated.docx")
-                        file_base = os.path.basename(doc['name'])
-                        validator_name = file_base.split('_')[3].capitalize()
-                        
-                        col_idx = idx % len(cols)
-                        with cols[col_idx]:
-                            # Determine MIME type based on file extension  
-                            if doc['name'].endswith('.docx'):
-                                mime_type = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-                            elif doc['name'].endswith('.doc'):
-                                mime_type = 'application/msword'
-                            elif doc['name'].endswith('.xlsx'):
-                                mime_type = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-                            elif doc['name'].endswith('.xls'):
-                                mime_type = 'application/vnd.ms-excel'
-                            else:
-                                mime_type = 'application/octet-stream'
-                            
-                            st.download_button(
-                                label=f"📝 {validator_name}",
-                                data=data,
-                                file_name=doc['name'],
-                                mime=mime_type
-                            )
-
-def run_processing(input_file: str):
+                    # Extract name from the filename (e.g. extract "Bernard" from "CP_validation_template_bernard_updated.docx")
+                    file_base = os.path.basename(doc['name'])
+                    validator_name = file_base.split('_')[3].capitalize()
+                    
+                    with cols[idx % len(cols)]:
+                        output_download_button(doc, f"📝 {validator_name}")
+
+def run_processing(input_file):
     """
-    1. Runs your main pipeline, which writes docs to 'output_docs/' 
+    1. Runs your main pipeline on the TSC document (a path or the uploaded bytes), which writes docs to 'output_docs/' 
     2. Copies those docs into NamedTemporaryFiles and stores them in session state.
     """
     st.info("Running pipeline (this might take some time) ...")
@@ -187,7 +172,7 @@ def run_processing(input_file: str):
     # Get CP type from session state
     cp_type = st.session_state.get('cp_type', "New CP")
 
-    # 1) Run the pipeline (async), passing the TSC doc path
+    # 1) Run the pipeline (async), passing the TSC doc
     asyncio.run(main(input_file))
 
     # 2) Now copy the relevant docx files from 'output_docs' to NamedTemporaryFiles
@@ -212,7 +197,7 @@ def run_processing(input_file: str):
     # Copy CP doc into tempfile
     if os.path.exists(cp_doc_path):
         with open(cp_doc_path, 'rb') as infile, tempfile.NamedTemporaryFile(delete=False, suffix=".docx") as outfile:
-            outfile.write(infile.read())
+            shutil.copyfileobj(infile, outfile, length=1024 * 1024)
             st.session_state['file_downloads']['cp_docx'] = {
                 'path': outfile.name,
                 'name': "CP_output.docx"
@@ -222,7 +207,7 @@ def run_processing(input_file: str):
     for doc_path in cv_doc_paths:
         if os.path.exists(doc_path):
             with open(doc_path, 'rb') as infile, tempfile.NamedTemporaryFile(delete=False, suffix=".docx") as outfile:
-                outfile.write(infile.read())
+                shutil.copyfileobj(infile, outfile, length=1024 * 1024)
                 desired_name = os.path.basename(doc_path)
                 st.session_state['file_downloads']['cv_docs'].append({
                     'path': outfile.name,
@@ -232,7 +217,7 @@ def run_processing(input_file: str):
     # Copy Excel file - only for New CP
     if cp_type == "New CP" and os.path.exists(excel_path):
         with open(excel_path, 'rb') as infile, tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx") as outfile:
-            outfile.write(infile.read())
+            shutil.copyfileobj(infile, outfile, length=1024 * 1024)
             st.session_state['file_downloads']['excel'] = {
                 'path': outfile.name,
                 'name': "CP_Excel_output.xlsx"
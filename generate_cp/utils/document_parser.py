@@ -1,34 +1,56 @@
 # document_parser.py
 
 from docx import Document
+import io
 import json
 from docx.oxml.text.paragraph import CT_P
 from docx.oxml.table import CT_Tbl
-from docx.table import Table
-from docx.text.paragraph import Paragraph
 import re
 
 def parse_document(input_docx, output_json):
-    # Load the document
-    doc = Document(input_docx)
+    # Load the document; uploads can be passed as raw bytes to skip a round-trip through disk
+    if isinstance(input_docx, (bytes, bytearray)):
+        doc = Document(io.BytesIO(input_docx))
+        source_name = "Uploaded document"
+    else:
+        doc = Document(input_docx)
+        source_name = input_docx
     
     # Initialize containers
     data = {
         "Course_Proposal_Form": {}
     }
+    # Keys of the text and tables already added to each section, for O(1) duplicate checks
+    seen_content = {}
     
-    # Function to parse tables with advanced duplication check
-    def parse_table(table):
+    # Function to parse tables with advanced duplication check. Works on the CT_Tbl element
+    # directly rather than through Table.rows/row.cells, which rebuild the whole merged-cell
+    # grid on every access, but resolves merged cells the same way row.cells does.
+    def parse_table(tbl_element):
         rows = []
-        for row in table.rows:
-            # Process each cell and ensure unique content within the row
-            cells = []
-            for cell in row.cells:
-                cell_text = cell.text.strip()
-                if cell_text not in cells:
-                    cells.append(cell_text)
+        seen_rows = set()
+        # Text of the cell covering each grid column in the previous row, so a vertically
+        # merged continuation cell repeats the text of the cell it is merged with
+        column_text = {}
+        for tr in tbl_element.tr_lst:
+            row_text = []
+            grid_col = 0
+            for tc in tr.tc_lst:
+                if tc.vMerge == "continue":
+                    cell_text = column_text.get(grid_col, "")
+                else:
+                    # Cell text is its paragraphs joined by newlines, as in _Cell.text
+                    cell_text = "\n".join(p.text for p in tc.p_lst).strip()
+                for span_col in range(grid_col, grid_col + tc.grid_span):
+                    column_text[span_col] = cell_text
+                grid_col += tc.grid_span
+                row_text.append(cell_text)
+            # Ensure unique content within the row (order preserved)
+            cells = list(dict.fromkeys(row_text))
             # Ensure unique rows within the table
-            if cells not in rows:
+            row_key = tuple(cells)
+            if row_key not in seen_rows:
+                seen_rows.add(row_key)
                 rows.append(cells)
         return rows
 
@@ -36,8 +58,14 @@ def parse_document(input_docx, output_json):
     def add_content_to_section(section_name, content):
         if section_name not in data["Course_Proposal_Form"]:
             data["Course_Proposal_Form"][section_name] = []
-        # Check for duplication before adding content
-        if content not in data["Course_Proposal_Form"][section_name]:
+        # Check for duplication before adding content; tables are keyed by their JSON form
+        if isinstance(content, str):
+            content_key = ("text", content)
+        else:
+            content_key = ("json", json.dumps(content, sort_keys=True))
+        section_seen = seen_content.setdefault(section_name, set())
+        if content_key not in section_seen:
+            section_seen.add(content_key)
             data["Course_Proposal_Form"][section_name].append(content)
 
     # Function to detect bullet points using regex
@@ -60,8 +88,7 @@ def parse_document(input_docx, output_json):
     # Iterate through the elements of the document
     for element in doc.element.body:
         if isinstance(element, CT_P):  # It's a paragraph
-            para = Paragraph(element, doc)
-            text = para.text.strip()
+            text = element.text.strip()
 
             # If the text indicates a new section, set current_section
             if text.startswith("Part") or text.startswith("LU"):
@@ -73,8 +100,7 @@ def parse_document(input_docx, output_json):
                 else:
                     add_content_to_section(current_section, text)
         elif isinstance(element, CT_Tbl):  # It's a table
-            tbl = Table(element, doc)
-            table_content = parse_table(tbl)
+            table_content = parse_table(element)
             if current_section:
                 add_content_to_section(current_section, {"table": table_content})
 
@@ -85,7 +111,7 @@ def parse_document(input_docx, output_json):
     with open(output_json, "w", encoding="utf-8") as json_file:
         json_file.write(json_output)
 
-    print(f"{input_docx} JSON output saved to {output_json}")
+    print(f"{source_name} JSON output saved to {output_json}")
 
 # if __name__ == "__main__":
 #     # Get input and output file paths from command-line arguments